@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark for the fetch -> score -> format pipeline.
+
+Runs against a fixture directory of recorded RSS XML and article HTML (see
+``record``) or against a generated synthetic corpus, times each stage, and
+writes the results as JSON so two runs can be compared.
+
+    python benchmark.py record fixtures/
+    python benchmark.py run --fixtures fixtures/ --scales 1 10 100 --output bench.json
+    python benchmark.py run --synthetic --compare bench.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
+
+import feedparser
+
+import bot
+
+
+FILLER_WORDS = (
+    "the team tested a new approach across several accounts and measured what changed "
+    "after publishing consistently for a month while comparing results with last year"
+).split()
+
+
+def slug_for(url: str) -> str:
+    parts = urlsplit(url)
+    raw = f"{parts.netloc}{parts.path}".strip("/")
+    return "".join(char if char.isalnum() else "_" for char in raw)[:120] or "index"
+
+
+def write_index(directory: str, index: dict) -> None:
+    with open(os.path.join(directory, "index.json"), "w", encoding="utf-8") as file:
+        json.dump(index, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def record_fixtures(directory: str, articles_per_feed: int) -> None:
+    """Download the current RSS_FEEDS and their newest articles into a fixture directory."""
+    os.makedirs(os.path.join(directory, "feeds"), exist_ok=True)
+    os.makedirs(os.path.join(directory, "articles"), exist_ok=True)
+    index = {}
+
+    for feed_config in bot.RSS_FEEDS:
+        print(f"Recording feed: {feed_config['name']}")
+        try:
+            response = bot.HTTP.get(feed_config["url"])
+            response.raise_for_status()
+        except bot.requests.RequestException as exc:
+            print(f"  skipped: {exc}")
+            continue
+
+        path = os.path.join("feeds", f"{slug_for(feed_config['url'])}.xml")
+        with open(os.path.join(directory, path), "wb") as file:
+            file.write(response.content)
+        index[feed_config["url"]] = {
+            "path": path,
+            "content_type": response.headers.get("content-type", "application/rss+xml"),
+        }
+
+        feed = feedparser.parse(response.content)
+        for raw_entry in feed.entries[:articles_per_feed]:
+            link = raw_entry.get("link", "").strip()
+            if not link or link in index:
+                continue
+            try:
+                article = bot.HTTP.get(link)
+                article.raise_for_status()
+            except bot.requests.RequestException as exc:
+                print(f"  article skipped: {exc}")
+                continue
+            path = os.path.join("articles", f"{slug_for(link)}.html")
+            with open(os.path.join(directory, path), "wb") as file:
+                file.write(article.content)
+            index[link] = {
+                "path": path,
+                "content_type": article.headers.get("content-type", "text/html"),
+            }
+
+    write_index(directory, index)
+    print(f"Recorded {len(index)} responses into {directory}")
+
+
+def synthetic_sentence(rng: random.Random, keywords: list[str]) -> str:
+    words = rng.sample(FILLER_WORDS, 10)
+    for _ in range(rng.randint(1, 3)):
+        words.insert(rng.randint(0, len(words)), rng.choice(keywords))
+    return " ".join(words).capitalize() + "."
+
+
+def generate_synthetic_fixtures(directory: str, feeds: int = 9, items_per_feed: int = 20) -> None:
+    """Build a deterministic fixture corpus shaped like the real feeds."""
+    rng = random.Random(1234)
+    keywords = list(bot.KEYWORD_MATCHER.weights)
+    os.makedirs(os.path.join(directory, "feeds"), exist_ok=True)
+    os.makedirs(os.path.join(directory, "articles"), exist_ok=True)
+    index = {}
+
+    for feed_number in range(feeds):
+        # Reuse the real feed URLs so `bot.py --fixtures` works on this corpus too.
+        if feed_number < len(bot.RSS_FEEDS):
+            feed_url = bot.RSS_FEEDS[feed_number]["url"]
+        else:
+            feed_url = f"https://feed{feed_number}.example.com/feed/"
+        host = urlsplit(feed_url).netloc
+        items = []
+        for item_number in range(items_per_feed):
+            link = f"https://{host}/synthetic/{feed_number}/{item_number}/"
+            title = " ".join(rng.sample(keywords, 3)).title()
+            summary = " ".join(synthetic_sentence(rng, keywords) for _ in range(3))
+            body = "".join(f"<p>{synthetic_sentence(rng, keywords)}</p>" for _ in range(12))
+            items.append(
+                f"<item><title>{title}</title><link>{link}</link>"
+                f"<pubDate>Mon, 0{1 + item_number % 9} Jun 2026 10:00:00 +0000</pubDate>"
+                f"<description><![CDATA[{summary}]]></description>"
+                f"<content:encoded><![CDATA[{body}]]></content:encoded></item>"
+            )
+
+            paragraphs = "".join(f"<p>{synthetic_sentence(rng, keywords)}</p>" for _ in range(60))
+            article = (
+                "<!doctype html><html><head><meta charset='utf-8'><title>Post</title>"
+                f"<script>{'var x = 1;' * 2000}</script></head><body>"
+                "<nav><a href='/'>Home</a><a href='/blog'>Blog</a></nav>"
+                f"<article><h1>{title}</h1>{paragraphs}</article>"
+                "<footer><p>All rights reserved. Subscribe to our newsletter.</p></footer>"
+                "</body></html>"
+            )
+            path = os.path.join("articles", f"feed{feed_number}_{item_number}.html")
+            with open(os.path.join(directory, path), "w", encoding="utf-8") as file:
+                file.write(article)
+            index[link] = {"path": path, "content_type": "text/html; charset=utf-8"}
+
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+            f"<channel><title>Feed {feed_number}</title><link>{feed_url}</link>"
+            + "".join(items)
+            + "</channel></rss>"
+        )
+        path = os.path.join("feeds", f"feed{feed_number}.xml")
+        with open(os.path.join(directory, path), "w", encoding="utf-8") as file:
+            file.write(xml)
+        index[feed_url] = {"path": path, "content_type": "application/rss+xml"}
+
+    write_index(directory, index)
+
+
+def load_corpus(directory: str) -> tuple[list[dict], list[bytes], list[bytes]]:
+    with open(os.path.join(directory, "index.json"), "r", encoding="utf-8") as file:
+        index = json.load(file)
+
+    feed_configs, feed_bodies, article_bodies = [], [], []
+    for url, item in sorted(index.items()):
+        with open(os.path.join(directory, item["path"]), "rb") as file:
+            body = file.read()
+        if item["path"].startswith("feeds"):
+            known = next((feed for feed in bot.RSS_FEEDS if feed["url"] == url), None)
+            feed_configs.append(
+                known
+                or {"name": urlsplit(url).netloc, "url": url, "focus": "creator growth", "weight": 2}
+            )
+            feed_bodies.append(body)
+        else:
+            article_bodies.append(body)
+    return feed_configs, feed_bodies, article_bodies
+
+
+def scaled_feeds(feed_configs: list[dict], scale: int) -> list[dict]:
+    """Repeat the recorded feeds ``scale`` times under distinct URLs."""
+    feeds = []
+    for copy in range(scale):
+        for feed_config in feed_configs:
+            feeds.append({**feed_config, "name": f"{feed_config['name']} #{copy}", "url": f"{feed_config['url']}?copy={copy}"})
+    return feeds
+
+
+def quiet(func):
+    """Run ``func`` with the bot's progress output suppressed."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return func()
+
+
+def measure(name: str, func, units: int, unit_name: str, nbytes: int = 0, repeat: int = 3) -> dict:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        quiet(func)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    quiet(func)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    result = {
+        "stage": name,
+        "seconds": best,
+        "median_seconds": statistics.median(timings),
+        f"{unit_name}_per_second": units / best if best else 0.0,
+        "units": units,
+        "peak_memory_bytes": peak,
+    }
+    if nbytes:
+        result["mb_per_second"] = nbytes / 1_000_000 / best if best else 0.0
+    print(
+        f"  {name:<22} {best * 1000:9.1f} ms  {result[f'{unit_name}_per_second']:10.1f} {unit_name}/s"
+        + (f"  {result['mb_per_second']:7.1f} MB/s" if nbytes else "")
+        + f"  peak {peak / 1_000_000:7.1f} MB"
+    )
+    return result
+
+
+def fetch_candidates(feeds: list[dict]) -> list:
+    """Fetch and score the feeds into a fresh in-memory backlog and return its ranked candidates."""
+    backlog = bot.CandidateBacklog(path=None, max_age_days=None)
+    bot.fetch_research_entries(feeds=feeds, workers=bot.FETCH_WORKERS, backlog=backlog)
+    return backlog.ranked()
+
+
+def run_stages(directory: str, scale: int, repeat: int) -> list[dict]:
+    feed_configs, feed_bodies, article_bodies = load_corpus(directory)
+    feed_bodies = feed_bodies * scale
+    feed_bytes = sum(len(body) for body in feed_bodies)
+    article_bytes = sum(len(body) for body in article_bodies)
+
+    parsed = [feedparser.parse(body) for body in feed_bodies]
+    raw_entries = [raw_entry for feed in parsed for raw_entry in feed.entries]
+    cleaned = [bot.clean_feed_content(raw_entry) for raw_entry in raw_entries]
+    texts = [
+        " ".join([bot.normalize_text(raw_entry.get("title", "")), summary, content])
+        for raw_entry, (summary, content) in zip(raw_entries, cleaned)
+    ]
+    decoded_articles = [body.decode("utf-8", "replace") for body in article_bodies]
+    article_texts = []
+    for page in decoded_articles:
+        parser = bot.ArticleTextExtractor()
+        parser.feed(page)
+        article_texts.append(parser.text())
+
+    def extract_all():
+        for page in decoded_articles:
+            parser = bot.ArticleTextExtractor()
+            parser.feed(page)
+            parser.text()
+
+    print(f"Scale {scale}x: {len(feed_bodies)} feeds, {len(raw_entries)} entries, {len(article_bodies)} articles")
+    results = [
+        measure("feedparser.parse", lambda: [feedparser.parse(body) for body in feed_bodies], len(feed_bodies), "feeds", feed_bytes, repeat),
+        measure("parse_feed_stream", lambda: [bot.parse_feed_stream([body]) for body in feed_bodies], len(feed_bodies), "feeds", feed_bytes, repeat),
+        measure("clean_feed_content", lambda: [bot.clean_feed_content(raw_entry) for raw_entry in raw_entries], len(raw_entries), "entries", repeat=repeat),
+        measure("score_text", lambda: [bot.score_text(text) for text in texts], len(texts), "entries", repeat=repeat),
+        measure("extraction", extract_all, len(decoded_articles), "articles", article_bytes, repeat),
+        measure("choose_best_sentences", lambda: [bot.choose_best_sentences(text) for text in article_texts], len(article_texts), "articles", repeat=repeat),
+        measure("rank_sentences", lambda: bot.rank_sentences(article_texts), len(article_texts), "articles", repeat=repeat),
+    ]
+
+    feeds = scaled_feeds(feed_configs, scale)
+    entries = quiet(lambda: fetch_candidates(feeds))
+    candidates = entries[: min(len(entries), 20)]
+    results.append(
+        measure(
+            "build_thread",
+            lambda: [bot.build_thread(entry, use_cache=False) for entry in candidates],
+            len(candidates),
+            "threads",
+            repeat=repeat,
+        )
+    )
+
+    def end_to_end():
+        found = fetch_candidates(feeds)
+        selected = bot.select_entries(found, set(), 5)
+        bot.build_threads(selected, use_cache=False)
+
+    results.append(measure("end_to_end", end_to_end, len(raw_entries), "entries", feed_bytes, repeat))
+    for result in results:
+        result["scale"] = scale
+    return results
+
+
+def compare(previous_path: str, results: list[dict]) -> None:
+    with open(previous_path, "r", encoding="utf-8") as file:
+        previous = json.load(file)
+    before = {(item["scale"], item["stage"]): item for item in previous.get("results", [])}
+
+    print(f"\nCompared with {previous_path}:")
+    for item in results:
+        old = before.get((item["scale"], item["stage"]))
+        if not old or not old["seconds"]:
+            continue
+        change = (item["seconds"] - old["seconds"]) / old["seconds"] * 100
+        print(f"  {item['scale']:>4}x {item['stage']:<22} {old['seconds'] * 1000:9.1f} -> {item['seconds'] * 1000:9.1f} ms ({change:+.1f}%)")
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    directory = args.fixtures
+    temp_dir = None
+    if args.synthetic or not directory:
+        temp_dir = tempfile.mkdtemp(prefix="bot-bench-")
+        generate_synthetic_fixtures(temp_dir)
+        directory = temp_dir
+
+    # Keep the benchmark away from the real caches and the network.
+    cache_dir = tempfile.mkdtemp(prefix="bot-bench-cache-")
+    bot.HTTP.use_fixtures(directory)
+    bot.HTTP_CACHE = bot.HttpValidatorCache(os.path.join(cache_dir, "http_cache.json"))
+    bot.ARTICLE_CACHE = bot.ArticleCache(os.path.join(cache_dir, "articles"))
+
+    try:
+        results = []
+        for scale in args.scales:
+            results.extend(run_stages(directory, scale, args.repeat))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        if temp_dir:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "fixtures": "synthetic" if temp_dir else os.path.abspath(directory),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
+        print(f"\nSaved results to {args.output}")
+    if args.compare:
+        compare(args.compare, results)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the research bot pipeline offline.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="Record live feeds and articles as fixtures.")
+    record.add_argument("directory", help="Directory to write fixtures into.")
+    record.add_argument("--articles-per-feed", type=int, default=3)
+
+    run = commands.add_parser("run", help="Time each pipeline stage against fixtures.")
+    run.add_argument("--fixtures", help="Fixture directory created by 'record'.")
+    run.add_argument("--synthetic", action="store_true", help="Use a generated corpus instead of fixtures.")
+    run.add_argument("--scales", type=int, nargs="+", default=[1, 10], help="Feed count multipliers.")
+    run.add_argument("--repeat", type=int, default=3, help="Timed repetitions per stage.")
+    run.add_argument("--output", help="Write results to this JSON file.")
+    run.add_argument("--compare", help="Print the change against an earlier results file.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.command == "record":
+        record_fixtures(args.directory, args.articles_per_feed)
+    else:
+        run_benchmark(args)
+
+
+if __name__ == "__main__":
+    main()
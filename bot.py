@@ -7,26 +7,118 @@ best source into a readable Bluesky thread, and avoids reposting the same item.
 """
 
 import argparse
+import asyncio
+import base64
+import bisect
+import calendar
+import codecs
+import contextlib
+import cProfile
+import functools
 import hashlib
+import heapq
 import html
+import io
 import json
+import math
 import os
+import pstats
 import random
 import re
+import signal
+import sqlite3
+import sys
+import threading
 import time
-from dataclasses import dataclass
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from html.parser import HTMLParser
-from typing import Iterable
+from itertools import islice
+from typing import Container, Iterable
+from urllib.parse import urlsplit
+from xml.etree import ElementTree
 
 import feedparser
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
 
 
 MAX_POST_LENGTH = 300
+BLUESKY_PDS_URL = os.environ.get("BLUESKY_PDS_URL", "https://bsky.social").rstrip("/")
+SESSION_FILE = os.environ.get("BLUESKY_SESSION_FILE", ".bluesky_session.json")
+SESSION_REFRESH_MARGIN = 5 * 60
 POSTED_FILE = "posted_items.json"
+POSTED_LOG_FILE = "posted_items.log"
+POSTED_COMPACT_RATIO = 0.25
+BACKLOG_FILE = "candidate_backlog.json"
+BACKLOG_HALF_LIFE_HOURS = 48
+BACKLOG_MAX_AGE_DAYS = 7
+BACKLOG_MAX_CANDIDATES = 500
+BACKLOG_SEEN_PER_FEED = 500
+BACKLOG_CONTENT_CHARS = 4000
+BACKLOG_BODY_TOP_K = 50
+CANDIDATE_BODY_DIR = "candidate_bodies"
+FEED_MAX_ITEMS = 50
+FEED_STOP_AFTER_SEEN = 3
+FEED_CHUNK_SIZE = 16_384
+FEED_HEALTH_FILE = "feed_health.json"
+FEED_POLL_MIN_SECONDS = 15 * 60
+FEED_POLL_MAX_SECONDS = 48 * 60 * 60
+FEED_BACKOFF_MAX_SECONDS = 7 * 24 * 60 * 60
+FEED_SLOW_SECONDS = 10.0
+FEED_HEALTH_SMOOTHING = 0.3
+STRONG_ENTRY_SCORE = 10
+ENGAGEMENT_DB_FILE = os.environ.get("ENGAGEMENT_DB_FILE", "engagement.db")
+ENGAGEMENT_BATCH_SIZE = 25
+# (post age, re-check interval) in seconds. Posts older than the last age are settled.
+ENGAGEMENT_CHECK_SCHEDULE = (
+    (6 * 60 * 60, 60 * 60),
+    (24 * 60 * 60, 3 * 60 * 60),
+    (3 * 24 * 60 * 60, 12 * 60 * 60),
+    (7 * 24 * 60 * 60, 24 * 60 * 60),
+)
+ENGAGEMENT_MIN_THREADS = 3
+ENGAGEMENT_SOURCE_MAX_BONUS = 4
+ENGAGEMENT_KEYWORD_MAX_BONUS = 2
+NEAR_DUPLICATE_SIMILARITY = float(os.environ.get("NEAR_DUPLICATE_SIMILARITY", 0.4))
+HTTP_CACHE_FILE = "http_cache.json"
+HTTP_CACHE_MAX_AGE = 14 * 24 * 60 * 60
+HTTP_CACHE_MAX_BYTES = 8_000_000
+ARTICLE_CACHE_DIR = "article_cache"
+ARTICLE_CACHE_TTL = 3 * 24 * 60 * 60
+# Expired articles are kept this long so they can be revalidated with a conditional GET.
+ARTICLE_CACHE_MAX_AGE = 14 * 24 * 60 * 60
+ARTICLE_CACHE_MAX_BYTES = 50_000_000
+# Bump when ArticleTextExtractor output changes so cached text is re-extracted.
+EXTRACTION_VERSION = 1
 DEFAULT_THREADS_PER_RUN = 2
 REQUEST_TIMEOUT = 18
+FETCH_WORKERS = 8
+FETCH_PER_HOST_LIMIT = 2
+FETCH_DEADLINE = 60
+ARTICLE_MAX_BYTES = 2_000_000
+ARTICLE_TEXT_TARGET = 15_000
+ARTICLE_CHUNK_SIZE = 16_384
+BUILD_WORKERS = 4
+BM25_K1 = 1.2
+BM25_B = 0.75
+SENTENCE_DIVERSITY_SIMILARITY = 0.5
+MAX_PREVIEW_ENTRIES = 50
+REPLY_DELAY_RANGE = (6.0, 10.0)
+THREAD_DELAY_RANGE = (25.0, 45.0)
+TID_ALPHABET = "234567abcdefghijklmnopqrstuvwxyz"
+DAEMON_POLL_MINUTES = 15
+DAEMON_POST_MINUTES = 120
+HTTP_RETRIES = 3
+HTTP_BACKOFF_BASE = 1.0
+HTTP_BACKOFF_MAX = 30.0
+HTTP_POOL_SIZE = 10
 USER_AGENT = (
     "CreatorGrowthResearchBot/2.0 "
     "(RSS research digest; contact owner via Bluesky profile)"
@@ -154,6 +246,8 @@ NEGATIVE_KEYWORDS = {
     "event recap": -2,
 }
 
+SENTENCE_MIN_CHARS = 45
+SENTENCE_MAX_CHARS = 260
 NOISE_PHRASES = (
     "cookie",
     "privacy policy",
@@ -185,7 +279,7 @@ NOISE_PHRASES = (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchEntry:
     title: str
     link: str
@@ -196,6 +290,17 @@ class ResearchEntry:
     content: str
     item_id: str
     score: int
+    fingerprint: tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class ThreadTemplate:
+    """Fixed text around the posts of a thread."""
+
+    hook: str = "Creator growth research:\n\n"
+    signal: str = "Useful signal:\n\n"
+    action: str = "Creator move:\n\n"
+    hashtags: str = "\n\n#ContentCreator #CreatorEconomy #AudienceGrowth"
 
 
 class ArticleTextExtractor(HTMLParser):
@@ -209,6 +314,7 @@ class ArticleTextExtractor(HTMLParser):
         self._capture_depth = 0
         self._skip_depth = 0
         self._chunks = []
+        self.captured_chars = 0
 
     def handle_starttag(self, tag, attrs):
         tag = tag.lower()
@@ -230,54 +336,979 @@ class ArticleTextExtractor(HTMLParser):
             cleaned = normalize_text(data)
             if cleaned:
                 self._chunks.append(cleaned)
+                self.captured_chars += len(cleaned)
 
     def text(self):
-        return normalize_text(" ".join(self._chunks))
+        # Chunks are already normalized; only the paragraph breaks need collapsing.
+        return NormalizedText(" ".join(" ".join(self._chunks).split()))
+
+
+class Clock:
+    """Wall clock behind every timestamp, expiry check and pacing wait.
+
+    Durations that are only measured and reported use ``time.perf_counter``
+    directly. Replacing ``CLOCK`` with a virtual clock (see ``simulate.py``)
+    lets days of scheduled runs pass in seconds.
+    """
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def now(self) -> datetime:
+        return datetime.now(timezone.utc)
+
+    def sleep(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        """Sleep up to ``seconds``, returning early with True once ``event`` is set."""
+        return event.wait(seconds)
+
+    async def async_sleep(self, seconds: float) -> None:
+        await asyncio.sleep(seconds)
+
+
+CLOCK = Clock()
+
+
+SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = (1_000, 10_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 2_000_000, 5_000_000)
+
+
+class Metrics:
+    """Counters and histograms keyed by name and labels, exported once per run.
+
+    Everything is a no-op until ``enabled`` is set, so instrumented code pays
+    one attribute check when metrics are off.
+    """
+
+    PREFIX = "research_bot_"
+
+    def __init__(self):
+        self.enabled = False
+        self.counters = {}
+        self.histograms = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, labels: dict) -> tuple:
+        return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets: tuple = SECONDS_BUCKETS, **labels) -> None:
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = {"buckets": buckets, "counts": [0] * len(buckets), "count": 0, "sum": 0.0, "max": value}
+                self.histograms[key] = histogram
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram["counts"][index] += 1
+            histogram["count"] += 1
+            histogram["sum"] += value
+            histogram["max"] = max(histogram["max"], value)
+
+    def timer(self, name: str, **labels):
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._timer(name, labels)
+
+    @contextlib.contextmanager
+    def _timer(self, name: str, labels: dict):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, **labels)
+
+    def write_jsonl(self, path: str, run_id: str) -> None:
+        """Append one JSON object per metric, tagged with the run."""
+        timestamp = datetime.now(timezone.utc).isoformat()
+        with self._lock, open(path, "a", encoding="utf-8") as file:
+            for (name, labels), value in sorted(self.counters.items()):
+                line = {"ts": timestamp, "run_id": run_id, "type": "counter", "name": name, "labels": dict(labels), "value": value}
+                file.write(json.dumps(line) + "\n")
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                line = {
+                    "ts": timestamp,
+                    "run_id": run_id,
+                    "type": "histogram",
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": histogram["count"],
+                    "sum": histogram["sum"],
+                    "max": histogram["max"],
+                    "buckets": dict(zip(map(str, histogram["buckets"]), histogram["counts"])),
+                }
+                file.write(json.dumps(line) + "\n")
+
+    def write_prometheus(self, path: str) -> None:
+        """Write the node_exporter textfile-collector format, replacing the file atomically."""
+
+        def render_labels(labels, extra=()) -> str:
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ""
+            escaped = (
+                '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+                for key, value in pairs
+            )
+            return "{" + ",".join(escaped) + "}"
+
+        lines = []
+        with self._lock:
+            for name in sorted({name for name, _ in self.counters}):
+                metric = f"{self.PREFIX}{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                for (counter_name, labels), value in sorted(self.counters.items()):
+                    if counter_name == name:
+                        lines.append(f"{metric}{render_labels(labels)} {value}")
+            for name in sorted({name for name, _ in self.histograms}):
+                metric = f"{self.PREFIX}{name}"
+                lines.append(f"# TYPE {metric} histogram")
+                for (histogram_name, labels), histogram in sorted(self.histograms.items()):
+                    if histogram_name != name:
+                        continue
+                    for bound, count in zip(histogram["buckets"], histogram["counts"]):
+                        lines.append(f"{metric}_bucket{render_labels(labels, [('le', bound)])} {count}")
+                    lines.append(f"{metric}_bucket{render_labels(labels, [('le', '+Inf')])} {histogram['count']}")
+                    lines.append(f"{metric}_sum{render_labels(labels)} {histogram['sum']}")
+                    lines.append(f"{metric}_count{render_labels(labels)} {histogram['count']}")
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+
+
+METRICS = Metrics()
+
+
+def timed_stage(stage: str):
+    """Record the wrapped function's duration as ``stage_seconds{stage=...}``."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not METRICS.enabled:
+                return func(*args, **kwargs)
+            with METRICS.timer("stage_seconds", stage=stage):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class StageProfiler:
+    """cProfile and tracemalloc around named pipeline stages (``--profile DIR``).
+
+    Each stage writes ``<stage>.pstats`` (open with ``python -m pstats``) and
+    ``<stage>.alloc.txt`` listing the allocation sites that grew the most
+    during the stage. cProfile only sees the thread that enabled it, so
+    profiled runs fetch and build inline rather than on worker pools.
+    """
+
+    TOP_ALLOCATIONS = 25
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.rows = []
+        os.makedirs(directory, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        before = self._snapshot()
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        profiler = cProfile.Profile()
+        started, cpu_started = time.perf_counter(), time.process_time()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            wall = time.perf_counter() - started
+            cpu = time.process_time() - cpu_started
+            _, peak = tracemalloc.get_traced_memory()
+            self._record(name, profiler, wall, cpu, peak - baseline, before)
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")]
+        )
+
+    def _record(self, name: str, profiler: cProfile.Profile, wall: float, cpu: float, peak: int, before) -> None:
+        growth = self._snapshot().compare_to(before, "lineno")
+        profiler.dump_stats(os.path.join(self.directory, f"{name}.pstats"))
+        stats = pstats.Stats(profiler)
+        hottest = "-"
+        if stats.stats:
+            (filename, line, function), row = max(stats.stats.items(), key=lambda item: item[1][2])
+            hottest = f"{function} ({os.path.basename(filename)}:{line})"
+
+        with open(os.path.join(self.directory, f"{name}.alloc.txt"), "w", encoding="utf-8") as file:
+            file.write(f"# {name}: peak {peak / 1e6:.2f} MB above the stage baseline\n")
+            for stat in growth[: self.TOP_ALLOCATIONS]:
+                file.write(f"{stat}\n")
+
+        self.rows.append((name, wall, cpu, peak, hottest))
+
+    def print_summary(self) -> None:
+        if not self.rows:
+            return
+        print(f"\nProfile ({self.directory}, times include profiler overhead):")
+        print(f"  {'stage':<8} {'wall s':>8} {'cpu s':>8} {'peak MB':>8}  hottest function")
+        for name, wall, cpu, peak, hottest in self.rows:
+            print(f"  {name:<8} {wall:>8.3f} {cpu:>8.3f} {peak / 1e6:>8.2f}  {hottest}")
+
+
+def profile_stage(profiler: StageProfiler | None, name: str):
+    return profiler.stage(name) if profiler else contextlib.nullcontext()
+
+
+class HttpClient:
+    """Shared keep-alive session with jittered retries and per-host latency counters."""
+
+    # 429 and 503 mean the request was not handled, so they are safe to retry for
+    # any method. Other 5xx responses are only retried for idempotent requests so
+    # a post is never published twice.
+    ALWAYS_RETRY_STATUSES = {429, 503}
+    IDEMPOTENT_RETRY_STATUSES = {500, 502, 504}
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+    def __init__(
+        self,
+        retries: int = HTTP_RETRIES,
+        backoff_base: float = HTTP_BACKOFF_BASE,
+        backoff_max: float = HTTP_BACKOFF_MAX,
+        pool_size: int = HTTP_POOL_SIZE,
+    ):
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", REQUEST_TIMEOUT)
+        method = method.upper()
+        host = urlsplit(url).netloc.lower()
+        idempotent = method in self.IDEMPOTENT_METHODS
+
+        for attempt in range(self.retries + 1):
+            started = time.perf_counter()
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException as exc:
+                self._record(host, time.perf_counter() - started, error=True)
+                METRICS.inc("http_errors", host=host, error=type(exc).__name__)
+                retryable = isinstance(exc, requests.ConnectTimeout) or (
+                    idempotent and isinstance(exc, (requests.ConnectionError, requests.Timeout))
+                )
+                if not retryable or attempt == self.retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+            else:
+                elapsed = time.perf_counter() - started
+                self._record(host, elapsed)
+                if METRICS.enabled:
+                    METRICS.observe("http_request_seconds", elapsed, host=host)
+                    METRICS.inc("http_responses", host=host, status=response.status_code)
+                    if not kwargs.get("stream"):
+                        METRICS.inc("http_bytes", len(response.content), host=host)
+                if not self._should_retry(response, idempotent) or attempt == self.retries:
+                    return response
+                delay = self._retry_after(response)
+                if delay is None:
+                    delay = self._backoff_delay(attempt)
+                elif delay > self.backoff_max:
+                    return response
+                response.close()
+
+            with self._lock:
+                self._host_stats(host)["retries"] += 1
+            METRICS.inc("http_retries", host=host)
+            CLOCK.sleep(delay)
+
+        raise RuntimeError("unreachable")
+
+    def _should_retry(self, response: requests.Response, idempotent: bool) -> bool:
+        if response.status_code in self.ALWAYS_RETRY_STATUSES:
+            return True
+        return idempotent and response.status_code in self.IDEMPOTENT_RETRY_STATUSES
+
+    def _backoff_delay(self, attempt: int) -> float:
+        ceiling = min(self.backoff_max, self.backoff_base * (2**attempt))
+        return random.uniform(ceiling / 2, ceiling)
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float | None:
+        value = response.headers.get("Retry-After", "").strip()
+        if not value:
+            return None
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - CLOCK.now()).total_seconds())
+
+    def _host_stats(self, host: str) -> dict:
+        return self.stats.setdefault(
+            host,
+            {"requests": 0, "errors": 0, "retries": 0, "seconds": 0.0, "max_seconds": 0.0},
+        )
+
+    def _record(self, host: str, elapsed: float, error: bool = False) -> None:
+        with self._lock:
+            stats = self._host_stats(host)
+            stats["requests"] += 1
+            stats["seconds"] += elapsed
+            stats["max_seconds"] = max(stats["max_seconds"], elapsed)
+            if error:
+                stats["errors"] += 1
+
+    def use_fixtures(self, directory: str) -> None:
+        """Answer every request from recorded fixtures, for offline runs."""
+        adapter = FixtureAdapter(directory)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def print_stats(self) -> None:
+        if not self.stats:
+            return
+        print("HTTP requests by host:")
+        for host, stats in sorted(self.stats.items()):
+            average = stats["seconds"] / stats["requests"] * 1000
+            print(
+                f"  {host}: {stats['requests']} requests, {stats['retries']} retries, "
+                f"{stats['errors']} errors, avg {average:.0f} ms, max {stats['max_seconds'] * 1000:.0f} ms"
+            )
+
+
+class FixtureAdapter(BaseAdapter):
+    """Serves recorded responses from a fixture directory instead of the network.
+
+    ``index.json`` maps each URL to ``{"path": ..., "content_type": ...}``
+    relative to the directory. A query string is ignored when the exact URL is
+    not recorded, so one fixture can stand in for many copies of a feed.
+    """
+
+    def __init__(self, directory: str):
+        super().__init__()
+        self.directory = directory
+        with open(os.path.join(directory, "index.json"), "r", encoding="utf-8") as file:
+            self.index = json.load(file)
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        url = request.url
+        item = self.index.get(url) or self.index.get(url.split("?", 1)[0])
+
+        response = requests.Response()
+        response.url = url
+        response.request = request
+        response.headers = CaseInsensitiveDict()
+        if item is None:
+            response.status_code = 404
+            response.raw = io.BytesIO(b"")
+        else:
+            with open(os.path.join(self.directory, item["path"]), "rb") as file:
+                body = file.read()
+            response.status_code = 200
+            response.headers["Content-Type"] = item.get("content_type", "text/html; charset=utf-8")
+            response.headers["Content-Length"] = str(len(body))
+            response.raw = io.BytesIO(body)
+        response.reason = "OK" if item else "Not Found"
+        response.encoding = get_encoding_from_headers(response.headers)
+        return response
+
+    def close(self):
+        pass
+
+
+HTTP = HttpClient()
+
+
+class HttpValidatorCache:
+    """On-disk ETag/Last-Modified cache that keeps the parsed feed entries per URL.
+
+    ``path=None`` keeps the entries in memory only.
+    """
+
+    def __init__(self, path: str | None, max_age: float = HTTP_CACHE_MAX_AGE, max_bytes: int = HTTP_CACHE_MAX_BYTES):
+        self.path = path
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._items = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self._items is not None:
+            return self._items
+
+        self._items = {}
+        if not self.path:
+            return self._items
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (json.JSONDecodeError, OSError):
+            return self._items
+
+        if isinstance(data, dict):
+            now = CLOCK.time()
+            self._items = {
+                url: item
+                for url, item in data.items()
+                if isinstance(item, dict) and now - item.get("checked_at", 0) <= self.max_age
+            }
+        return self._items
+
+    def request_headers(self, url: str) -> dict:
+        with self._lock:
+            item = self._load().get(url)
+        if not item:
+            return {}
+
+        headers = {}
+        if item.get("etag"):
+            headers["If-None-Match"] = item["etag"]
+        if item.get("last_modified"):
+            headers["If-Modified-Since"] = item["last_modified"]
+        return headers
+
+    def reuse(self, url: str):
+        """Return the stored payload after a 304 and mark it as freshly validated."""
+        with self._lock:
+            item = self._load().get(url)
+            if not item:
+                return None
+            item["checked_at"] = CLOCK.time()
+            self._dirty = True
+            return item["payload"]
+
+    def store(self, url: str, response: requests.Response, payload) -> None:
+        etag = response.headers.get("ETag", "")
+        last_modified = response.headers.get("Last-Modified", "")
+        with self._lock:
+            items = self._load()
+            if not etag and not last_modified:
+                if items.pop(url, None) is not None:
+                    self._dirty = True
+                return
+
+            items[url] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "checked_at": CLOCK.time(),
+                "payload": payload,
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self.path or not self._dirty or self._items is None:
+                return
+
+            now = CLOCK.time()
+            fresh = [
+                (url, item)
+                for url, item in self._items.items()
+                if now - item.get("checked_at", 0) <= self.max_age
+            ]
+            fresh.sort(key=lambda pair: pair[1].get("checked_at", 0), reverse=True)
+
+            kept = {}
+            total = 0
+            for url, item in fresh:
+                size = len(json.dumps(item, ensure_ascii=False))
+                if total + size > self.max_bytes:
+                    continue
+                kept[url] = item
+                total += size
+
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(kept, file, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            self._items = kept
+            self._dirty = False
+
+
+HTTP_CACHE = HttpValidatorCache(HTTP_CACHE_FILE)
+
+
+class ArticleCache:
+    """Text stored one JSON file per key, with TTL and LRU eviction.
+
+    Keys are article URLs, or item IDs for candidate bodies spilled by
+    ``CandidateBacklog``. Items are served for ``ttl`` seconds and kept for
+    ``max_age``; in between, an article's ``ETag``/``Last-Modified`` let it be
+    revalidated instead of downloaded again. Each item records a sha256 of
+    its text, so putting the same text again while the item is fresh leaves
+    the file alone. ``directory=None`` keeps the items in memory.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = ARTICLE_CACHE_DIR,
+        ttl: float = ARTICLE_CACHE_TTL,
+        max_bytes: int = ARTICLE_CACHE_MAX_BYTES,
+        max_age: float = ARTICLE_CACHE_MAX_AGE,
+    ):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.max_age = max(ttl, max_age)
+        self._memory = {} if directory is None else None
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> str:
+        name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name}.json")
+
+    def _read(self, url: str) -> dict | None:
+        """The stored item for ``url`` if it was extracted by the current extractor, fresh or not."""
+        if self._memory is not None:
+            item = self._memory.get(url)
+        else:
+            try:
+                with open(self._path(url), "r", encoding="utf-8") as file:
+                    item = json.load(file)
+            except (json.JSONDecodeError, OSError):
+                return None
+
+        if (
+            not isinstance(item, dict)
+            or item.get("url") != url
+            or item.get("extraction_version") != EXTRACTION_VERSION
+        ):
+            return None
+        return item
+
+    def _is_fresh(self, item: dict) -> bool:
+        return CLOCK.time() - item.get("fetched_at", 0) <= self.ttl
+
+    def get(self, url: str) -> str | None:
+        item = self._read(url)
+        if item is None or not self._is_fresh(item):
+            return None
+
+        if self._memory is None:
+            try:
+                os.utime(self._path(url))
+            except OSError:
+                pass
+        return item.get("text", "")
+
+    def request_headers(self, url: str) -> dict:
+        """Conditional request headers for a stored copy of ``url``, fresh or not."""
+        item = self._read(url)
+        if item is None:
+            return {}
+        headers = {}
+        if item.get("etag"):
+            headers["If-None-Match"] = item["etag"]
+        if item.get("last_modified"):
+            headers["If-Modified-Since"] = item["last_modified"]
+        return headers
+
+    def revalidate(self, url: str) -> str | None:
+        """Return the stored text after a 304 and mark it fresh again."""
+        item = self._read(url)
+        if item is None:
+            return None
+        item["fetched_at"] = CLOCK.time()
+        self._write(url, item)
+        return item.get("text", "")
+
+    def put(self, url: str, text: str, etag: str = "", last_modified: str = "") -> bool:
+        """Store ``text`` for ``url`` and return whether it differs from the fresh stored copy."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        current = self._read(url)
+        if (
+            current is not None
+            and current.get("sha256") == digest
+            and current.get("etag", "") == etag
+            and current.get("last_modified", "") == last_modified
+            and self._is_fresh(current)
+        ):
+            return False
+
+        item = {
+            "url": url,
+            "text": text,
+            "sha256": digest,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": CLOCK.time(),
+            "extraction_version": EXTRACTION_VERSION,
+        }
+        self._write(url, item)
+        return True
+
+    def _write(self, url: str, item: dict) -> None:
+        if self._memory is not None:
+            with self._lock:
+                self._memory[url] = item
+            return
+        path = self._path(url)
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(item, file, ensure_ascii=False)
+            os.replace(tmp_path, path)
+
+    def evict(self) -> None:
+        """Drop files older than max_age, then the least recently used ones until under max_bytes."""
+        if self._memory is not None:
+            return
+        with self._lock:
+            try:
+                names = os.listdir(self.directory)
+            except OSError:
+                return
+
+            now = CLOCK.time()
+            files = []
+            for name in names:
+                path = os.path.join(self.directory, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if now - stat.st_mtime > self.max_age:
+                    os.remove(path)
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                os.remove(path)
+                total -= size
+
+
+ARTICLE_CACHE = ArticleCache()
+
+
+def use_memory_caches() -> None:
+    """Swap the HTTP and article caches for in-memory ones, so offline runs leave the real files alone."""
+    global HTTP_CACHE, ARTICLE_CACHE
+    HTTP_CACHE = HttpValidatorCache(None)
+    ARTICLE_CACHE = ArticleCache(None)
+
+
+TAG_RE = re.compile(r"<[^>]+>")
+BLANK_LINES_RE = re.compile(r"\n{3,}")
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+PUNCTUATION_TABLE = str.maketrans(
+    {
+        "\u2019": "'",
+        "\u2018": "'",
+        "\u201c": '"',
+        "\u201d": '"',
+        "\u2013": " - ",
+        "\u2014": " - ",
+    }
+)
+
+
+class NormalizedText(str):
+    """A str already passed through normalize_text, so it is returned as-is."""
+
+    __slots__ = ()
 
 
 def normalize_text(value: str) -> str:
-    value = html.unescape(value or "")
-    value = re.sub(r"<[^>]+>", " ", value)
-    value = value.replace("\u2019", "'").replace("\u2018", "'")
-    value = value.replace("\u201c", '"').replace("\u201d", '"')
-    value = value.replace("\u2013", " - ").replace("\u2014", " - ")
-    value = re.sub(r"\s+", " ", value)
-    return value.strip()
+    if isinstance(value, NormalizedText):
+        return value
+    value = value or ""
+    if "&" in value:
+        value = html.unescape(value)
+    if "<" in value:
+        value = TAG_RE.sub(" ", value)
+    value = value.translate(PUNCTUATION_TABLE)
+    return NormalizedText(" ".join(value.split()))
+
+
+def join_normalized(parts: Iterable[str]) -> NormalizedText:
+    """Join normalized pieces with single spaces without normalizing them again."""
+    return NormalizedText(" ".join(normalize_text(part) for part in parts if part))
 
 
 def normalize_post_text(value: str) -> str:
     value = (value or "").replace("\r\n", "\n").replace("\r", "\n")
     lines = [normalize_text(line) for line in value.split("\n")]
     text = "\n".join(lines)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = BLANK_LINES_RE.sub("\n\n", text)
     return text.strip()
 
 
-def load_posted_items() -> list[str]:
-    if not os.path.exists(POSTED_FILE):
-        return []
+FINGERPRINT_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have how in into is it its of on or that the "
+    "this to was what when why will with you your new now more".split()
+)
+FINGERPRINT_WORD_RE = re.compile(r"[a-z0-9]+")
+MINHASH_BANDS = 21
+MINHASH_ROWS = 3
+MINHASH_PRIME = (1 << 61) - 1
+_minhash_random = random.Random(20240601)
+MINHASH_PERMUTATIONS = tuple(
+    (_minhash_random.randrange(1, MINHASH_PRIME), _minhash_random.randrange(0, MINHASH_PRIME))
+    for _ in range(MINHASH_BANDS * MINHASH_ROWS)
+)
 
-    try:
-        with open(POSTED_FILE, "r", encoding="utf-8") as file:
-            data = json.load(file)
-    except (json.JSONDecodeError, OSError):
-        return []
 
-    if not isinstance(data, list):
-        return []
+def story_fingerprint(title: str, summary: str, content: str = "") -> tuple[int, ...]:
+    """MinHash signature of the distinct words in a story's title and summary.
+
+    Content stands in when there is no summary. Matching slots between two
+    signatures estimate the Jaccard similarity of their word sets.
+    """
+    text = f"{title} {summary or content[:1000]}".lower()
+    words = {word for word in FINGERPRINT_WORD_RE.findall(text) if word not in FINGERPRINT_STOPWORDS}
+    if not words:
+        return ()
+
+    hashes = [int.from_bytes(hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(), "big") for word in words]
+    return tuple(
+        min((multiplier * value + offset) % MINHASH_PRIME for value in hashes) & 0xFFFFFFFF
+        for multiplier, offset in MINHASH_PERMUTATIONS
+    )
+
+
+def encode_fingerprint(fingerprint: tuple[int, ...]) -> str:
+    return "".join(f"{value:08x}" for value in fingerprint)
+
 
-    return [str(item) for item in data]
+def decode_fingerprint(value: str) -> tuple[int, ...]:
+    if len(value) != 8 * len(MINHASH_PERMUTATIONS):
+        return ()
+    return tuple(int(value[index : index + 8], 16) for index in range(0, len(value), 8))
 
 
-def save_posted_item(item_id: str) -> None:
-    posted = load_posted_items()
-    if item_id not in posted:
-        posted.append(item_id)
+class MinHashIndex:
+    """LSH index over MinHash signatures for near-duplicate story lookups.
 
-    posted = posted[-1000:]
-    with open(POSTED_FILE, "w", encoding="utf-8") as file:
-        json.dump(posted, file, indent=2)
-        file.write("\n")
+    Signatures are split into bands of ``MINHASH_ROWS`` values. Only items that
+    share a whole band with the query are compared, so a lookup touches a
+    handful of candidates instead of the whole history.
+    """
+
+    def __init__(self, threshold: float = NEAR_DUPLICATE_SIMILARITY):
+        self.threshold = threshold
+        self._buckets = [{} for _ in range(MINHASH_BANDS)]
+
+    def _bands(self, fingerprint: tuple[int, ...]):
+        for band in range(MINHASH_BANDS):
+            yield band, fingerprint[band * MINHASH_ROWS : (band + 1) * MINHASH_ROWS]
+
+    def add(self, item_id: str, fingerprint: tuple[int, ...]) -> None:
+        if len(fingerprint) != len(MINHASH_PERMUTATIONS):
+            return
+        for band, key in self._bands(fingerprint):
+            self._buckets[band].setdefault(key, []).append((item_id, fingerprint))
+
+    def find(self, fingerprint: tuple[int, ...]) -> str | None:
+        """Return the ID of a stored story at least ``threshold`` similar, or None."""
+        if len(fingerprint) != len(MINHASH_PERMUTATIONS):
+            return None
+
+        checked = set()
+        needed = self.threshold * len(fingerprint)
+        for band, key in self._bands(fingerprint):
+            for item_id, other in self._buckets[band].get(key, ()):
+                if item_id in checked:
+                    continue
+                checked.add(item_id)
+                if sum(left == right for left, right in zip(fingerprint, other)) >= needed:
+                    return item_id
+        return None
+
+
+class PostedStore:
+    """Append-only log of posted item IDs with an in-memory set index.
+
+    Each line is ``<item_id> <unix time> [<story fingerprint hex>]``. Adding an
+    item appends one line, so the cost per post stays flat however long the
+    history gets. Fingerprints feed a MinHashIndex used to spot the same story
+    published by another source under a different link. Items older
+    than ``max_age_days`` or beyond the newest ``max_items`` are dropped when
+    enough of the log has expired to make rewriting it worthwhile. A legacy
+    ``posted_items.json`` is imported in memory and only written out as a log
+    with the first new post, so dry runs leave the disk alone.
+    """
+
+    def __init__(
+        self,
+        path: str = POSTED_LOG_FILE,
+        legacy_path: str | None = POSTED_FILE,
+        max_items: int | None = None,
+        max_age_days: float | None = None,
+    ):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.max_items = max_items
+        self.max_age_days = max_age_days
+        self._posted = {}
+        self._fingerprints = {}
+        self._log_lines = 0
+        self._unwritten_import = False
+        self.similar = MinHashIndex()
+        self._load()
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._posted
+
+    def __len__(self) -> int:
+        return len(self._posted)
+
+    def add(self, item_id: str, fingerprint: tuple[int, ...] = ()) -> None:
+        if item_id in self._posted:
+            return
+        posted_at = int(CLOCK.time())
+        self._posted[item_id] = posted_at
+        if fingerprint:
+            self._fingerprints[item_id] = fingerprint
+            self.similar.add(item_id, fingerprint)
+        if self._unwritten_import:
+            self._rewrite()
+            return
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(self._format_line(item_id, posted_at))
+        self._log_lines += 1
+
+    def find_similar(self, fingerprint: tuple[int, ...]) -> str | None:
+        return self.similar.find(fingerprint)
+
+    def _format_line(self, item_id: str, posted_at: int) -> str:
+        fingerprint = self._fingerprints.get(item_id)
+        if fingerprint:
+            return f"{item_id} {posted_at} {encode_fingerprint(fingerprint)}\n"
+        return f"{item_id} {posted_at}\n"
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            self._import_legacy()
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                for line in file:
+                    parts = line.split()
+                    if not parts:
+                        continue
+                    self._log_lines += 1
+                    posted_at = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+                    self._posted[parts[0]] = posted_at
+                    if len(parts) > 2:
+                        try:
+                            fingerprint = decode_fingerprint(parts[2])
+                        except ValueError:
+                            fingerprint = ()
+                        if fingerprint:
+                            self._fingerprints[parts[0]] = fingerprint
+        except OSError:
+            return
+
+        self._apply_retention()
+        for item_id, fingerprint in self._fingerprints.items():
+            self.similar.add(item_id, fingerprint)
+
+    def _import_legacy(self) -> None:
+        if not self.legacy_path or not os.path.exists(self.legacy_path):
+            return
+
+        try:
+            with open(self.legacy_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (json.JSONDecodeError, OSError):
+            return
+
+        if not isinstance(data, list):
+            return
+
+        imported_at = int(CLOCK.time())
+        for item in data:
+            self._posted[str(item)] = imported_at
+        self._unwritten_import = True
+        print(f"Imported {len(self._posted)} posted items from {self.legacy_path}")
+
+    def _apply_retention(self) -> None:
+        items = list(self._posted.items())
+        if self.max_age_days is not None:
+            cutoff = CLOCK.time() - self.max_age_days * 86400
+            items = [(item_id, posted_at) for item_id, posted_at in items if posted_at >= cutoff]
+        if self.max_items is not None:
+            items.sort(key=lambda pair: pair[1])
+            items = items[-self.max_items :] if self.max_items > 0 else []
+
+        if len(items) != len(self._posted):
+            self._posted = dict(items)
+            self._fingerprints = {
+                item_id: fingerprint
+                for item_id, fingerprint in self._fingerprints.items()
+                if item_id in self._posted
+            }
+
+        stale_lines = self._log_lines - len(self._posted)
+        if stale_lines > max(1, self._log_lines * POSTED_COMPACT_RATIO):
+            self._rewrite()
+
+    def _rewrite(self) -> None:
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            for item_id, posted_at in self._posted.items():
+                file.write(self._format_line(item_id, posted_at))
+        os.replace(tmp_path, self.path)
+        self._log_lines = len(self._posted)
+        self._unwritten_import = False
+
+
+def load_posted_store(account: "AccountProfile | None" = None) -> PostedStore:
+    account = account or DEFAULT_ACCOUNT
+    max_items = os.environ.get("POSTED_RETENTION_ITEMS")
+    max_age_days = os.environ.get("POSTED_RETENTION_DAYS")
+    return PostedStore(
+        path=account.path(POSTED_LOG_FILE),
+        legacy_path=account.path(POSTED_FILE),
+        max_items=int(max_items) if max_items else None,
+        max_age_days=float(max_age_days) if max_age_days else None,
+    )
 
 
 def get_item_id(title: str, link: str) -> str:
@@ -292,106 +1323,1051 @@ def clean_feed_content(entry) -> tuple[str, str]:
     for content_item in entry.get("content", []) or []:
         content_parts.append(normalize_text(content_item.get("value", "")))
 
-    return summary, normalize_text(" ".join(content_parts))
+    return summary, join_normalized(content_parts)
+
+
+def lowered_corpus(texts: list[str]) -> tuple[str, list[int]]:
+    """Lowercase single-line texts and join them with newlines, returning each one's start offset."""
+    lowered = [text.lower() for text in texts]
+    starts = []
+    offset = 0
+    for text in lowered:
+        starts.append(offset)
+        offset += len(text) + 1
+    return "\n".join(lowered), starts
+
+
+class KeywordMatcher:
+    """Scores text against several keyword dictionaries in one regex pass.
+
+    All keywords are compiled into a single trie-shaped alternation, so the
+    cost of a scan grows with the text rather than the number of keywords.
+    Each search resumes one character after the previous match start, which
+    catches overlapping keywords. Shorter keywords contained in a longer
+    match (``creator`` in ``creator economy``) are credited through a
+    precomputed containment map, keeping totals equal to checking each
+    keyword with ``in``.
+    """
+
+    def __init__(self, keyword_sets: Iterable[dict[str, int]], word_boundaries: bool = False):
+        self.weights = {}
+        for keywords in keyword_sets:
+            for keyword, weight in keywords.items():
+                keyword = keyword.lower()
+                if keyword:
+                    self.weights[keyword] = self.weights.get(keyword, 0) + weight
+
+        self.word_boundaries = word_boundaries
+        alternation = self._trie_pattern(self.weights)
+        if word_boundaries:
+            alternation = rf"\b{alternation}\b"
+        self.pattern = re.compile(alternation) if self.weights else None
+
+        self.contained = {
+            keyword: frozenset(other for other in self.weights if self._occurs(other, keyword))
+            for keyword in self.weights
+        }
+
+    @staticmethod
+    def _trie_pattern(keywords: Iterable[str]) -> str:
+        trie = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        def build(node: dict) -> str:
+            branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+            if not branches:
+                return ""
+            if len(branches) == 1 and "" not in node:
+                return branches[0]
+            group = "(?:" + "|".join(branches) + ")"
+            return group + "?" if "" in node else group
+
+        return build(trie)
+
+    def _occurs(self, needle: str, haystack: str) -> bool:
+        if not self.word_boundaries:
+            return needle in haystack
+        return re.search(rf"\b{re.escape(needle)}\b", haystack) is not None
+
+    def hits(self, text: str) -> set[str]:
+        if self.pattern is None:
+            return set()
+
+        lowered = text.lower()
+        search = self.pattern.search
+        hits = set()
+        position = 0
+        while True:
+            match = search(lowered, position)
+            if match is None:
+                return hits
+            hits |= self.contained[match.group()]
+            position = match.start() + 1
+
+    def hits_many(self, texts: list[str]) -> list[set[str]]:
+        """``hits`` for many single-line texts with one scan over their concatenation."""
+        results = [set() for _ in texts]
+        if self.pattern is None or not texts:
+            return results
+
+        corpus, starts = lowered_corpus(texts)
+        search = self.pattern.search
+        position = 0
+        while True:
+            match = search(corpus, position)
+            if match is None:
+                return results
+            results[bisect.bisect_right(starts, match.start()) - 1] |= self.contained[match.group()]
+            position = match.start() + 1
+
+    def score(self, text: str, source_weight: int = 0) -> tuple[int, list[str]]:
+        hits = self.hits(text)
+        total = source_weight + sum(self.weights[keyword] for keyword in hits)
+        return total, sorted(hits)
+
+
+KEYWORD_WORD_BOUNDARIES = os.environ.get("KEYWORD_WORD_BOUNDARIES", "").lower() in {"1", "true", "yes"}
+KEYWORD_MATCHER = KeywordMatcher(
+    (POSITIVE_KEYWORDS, ACTION_KEYWORDS, NEGATIVE_KEYWORDS),
+    word_boundaries=KEYWORD_WORD_BOUNDARIES,
+)
 
 
 def score_text(text: str, source_weight: int = 0) -> int:
-    lowered = text.lower()
-    score = source_weight
+    return KEYWORD_MATCHER.score(text, source_weight)[0]
+
+
+def compact_feed_entry(raw_entry) -> dict:
+    """Keep only the feedparser fields the bot reads, in a JSON-friendly shape."""
+    parsed_time = raw_entry.get("published_parsed") or raw_entry.get("updated_parsed")
+    return {
+        "id": raw_entry.get("id", "") or raw_entry.get("link", ""),
+        "title": raw_entry.get("title", ""),
+        "link": raw_entry.get("link", ""),
+        "published": raw_entry.get("published", ""),
+        "published_at": calendar.timegm(parsed_time) if parsed_time else None,
+        "summary": raw_entry.get("summary", ""),
+        "content": [
+            {"value": content_item.get("value", "")}
+            for content_item in raw_entry.get("content", []) or []
+        ],
+    }
 
-    for keyword, weight in POSITIVE_KEYWORDS.items():
-        if keyword in lowered:
-            score += weight
 
-    for keyword, weight in ACTION_KEYWORDS.items():
-        if keyword in lowered:
-            score += weight
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+RSS1_NS = "{http://purl.org/rss/1.0/}"
+RSS_CONTENT_ENCODED = "{http://purl.org/rss/1.0/modules/content/}encoded"
+DC_DATE = "{http://purl.org/dc/elements/1.1/}date"
+FEED_ROOT_TAGS = {"rss", "{http://www.w3.org/1999/02/22-rdf-syntax-ns#}RDF", f"{ATOM_NS}feed"}
+SCRIPT_STYLE_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
 
-    for keyword, weight in NEGATIVE_KEYWORDS.items():
-        if keyword in lowered:
-            score += weight
 
-    return score
+def parse_feed_date(value: str) -> int | None:
+    """Unix time for an RFC 822 (RSS) or ISO 8601 (Atom, Dublin Core) date."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
 
 
-def fetch_feed_entries(feed_config: dict) -> list[ResearchEntry]:
-    print(f"Fetching feed: {feed_config['name']}")
+def strip_scripts(value: str) -> str:
+    return SCRIPT_STYLE_RE.sub("", value) if "<" in value else value
+
+
+def element_text(element: ElementTree.Element | None) -> str:
+    """Text of an element, including child markup such as an Atom ``type="xhtml"`` ``<div>``."""
+    if element is None:
+        return ""
+    return " ".join(element.itertext()) if len(element) else element.text or ""
+
+
+def stream_entry(item: ElementTree.Element) -> dict:
+    """Read one RSS ``<item>`` or Atom ``<entry>`` into the ``compact_feed_entry`` shape."""
+    if item.tag == f"{ATOM_NS}entry":
+        link = ""
+        for link_element in item.iterfind(f"{ATOM_NS}link"):
+            if link_element.get("rel", "alternate") == "alternate":
+                link = link_element.get("href", "")
+                break
+        guid = item.findtext(f"{ATOM_NS}id", "")
+        published = item.findtext(f"{ATOM_NS}published", "")
+        updated = item.findtext(f"{ATOM_NS}updated", "")
+        summary = element_text(item.find(f"{ATOM_NS}summary"))
+        content_element = item.find(f"{ATOM_NS}content")
+        title = element_text(item.find(f"{ATOM_NS}title"))
+    else:
+        namespace = RSS1_NS if item.tag == f"{RSS1_NS}item" else ""
+        title = item.findtext(f"{namespace}title", "")
+        link = item.findtext(f"{namespace}link", "")
+        guid_element = item.find("guid")
+        guid = (guid_element.text or "") if guid_element is not None else ""
+        if not link and guid.startswith("http") and guid_element.get("isPermaLink", "true") != "false":
+            link = guid
+        published = item.findtext("pubDate", "")
+        updated = item.findtext(DC_DATE, "")
+        summary = item.findtext(f"{namespace}description", "")
+        content_element = item.find(RSS_CONTENT_ENCODED)
+
+    content = strip_scripts(element_text(content_element))
+    # feedparser fills a missing summary with the content; keep doing the same.
+    summary = strip_scripts(summary) or content
+    link = link.strip()
+    return {
+        "id": guid.strip() or link,
+        "title": title,
+        "link": link,
+        "published": published.strip(),
+        "published_at": parse_feed_date(published) or parse_feed_date(updated),
+        "summary": summary,
+        "content": [{"value": content}] if content else [],
+    }
+
+
+def parse_feed_stream(
+    chunks: Iterable[bytes],
+    max_items: int = FEED_MAX_ITEMS,
+    is_seen=None,
+    stop_after_seen: int = FEED_STOP_AFTER_SEEN,
+) -> list[dict]:
+    """Incrementally parse an RSS 2.0, RSS 1.0 or Atom feed, keeping only the fields the bot reads.
+
+    Parsing stops after ``max_items`` entries, or once ``stop_after_seen``
+    entries in a row are already known to ``is_seen(guid)``. Feeds are
+    newest-first, so that is where the new items end; requiring a short run
+    of known items keeps a pinned old post from hiding everything below it.
+    Raises ``ElementTree.ParseError`` or ``ValueError`` for documents
+    feedparser should handle instead.
+    """
+    parser = ElementTree.XMLPullParser(events=("start", "end"))
+    entries = []
+    seen_in_a_row = 0
+    root_checked = False
+    item_depth = 0
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if not root_checked:
+                if element.tag not in FEED_ROOT_TAGS:
+                    raise ValueError(f"not a feed document: {element.tag}")
+                root_checked = True
+
+            is_item = element.tag in ("item", f"{RSS1_NS}item", f"{ATOM_NS}entry")
+            if event == "start":
+                item_depth += is_item
+                continue
+            if not is_item:
+                continue
+            item_depth -= 1
+            if item_depth:
+                continue
+
+            entry = stream_entry(element)
+            element.clear()
+            entries.append(entry)
+            if is_seen is not None and is_seen(entry["id"]):
+                seen_in_a_row += 1
+            else:
+                seen_in_a_row = 0
+            if len(entries) >= max_items or (is_seen is not None and seen_in_a_row >= stop_after_seen):
+                return entries
+
+    parser.close()
+    if not root_checked:
+        raise ValueError("empty feed document")
+    return entries
+
+
+def read_feed_entries(response: requests.Response, feed_name: str, is_seen=None) -> tuple[list[dict], int]:
+    """Stream a feed response into ``parse_feed_stream``; malformed feeds go through feedparser.
+
+    Returns the compact entries and the number of bytes read.
+    """
+    chunks = []
+
+    def received_chunks():
+        for chunk in response.iter_content(chunk_size=FEED_CHUNK_SIZE):
+            chunks.append(chunk)
+            yield chunk
+
     try:
-        response = requests.get(
-            feed_config["url"],
-            headers={"User-Agent": USER_AGENT},
-            timeout=REQUEST_TIMEOUT,
+        with METRICS.timer("stage_seconds", stage="feed_stream_parse"):
+            return parse_feed_stream(received_chunks(), is_seen=is_seen), sum(map(len, chunks))
+    except (ElementTree.ParseError, ValueError):
+        METRICS.inc("feed_parse_fallbacks", feed=feed_name)
+
+    chunks.extend(response.iter_content(chunk_size=FEED_CHUNK_SIZE))
+    body = b"".join(chunks)
+    with METRICS.timer("stage_seconds", stage="feedparser.parse"):
+        feed = feedparser.parse(body)
+    return [compact_feed_entry(raw_entry) for raw_entry in feed.entries[:FEED_MAX_ITEMS]], len(body)
+
+
+class CandidateBacklog:
+    """Scored candidates kept between runs, plus per-feed high-water marks.
+
+    Each feed remembers the GUIDs it has already produced, so a run only
+    normalizes and scores entries it has not seen before. Candidates are
+    ranked by score decayed with age (half-life ``half_life_hours``) and
+    dropped after ``max_age_days``, or never with ``max_age_days=None``.
+    ``path=None`` keeps everything in memory.
+
+    The pool is trimmed back to ``max_candidates`` whenever it doubles, so a
+    run over many feeds never holds more than that. With a ``bodies`` store,
+    only the best ``body_top_k`` candidates keep their content in memory; the
+    rest are written there and loaded again by ``research_text_for``.
+    """
+
+    def __init__(
+        self,
+        path: str | None = BACKLOG_FILE,
+        half_life_hours: float = BACKLOG_HALF_LIFE_HOURS,
+        max_age_days: float | None = BACKLOG_MAX_AGE_DAYS,
+        max_candidates: int = BACKLOG_MAX_CANDIDATES,
+        bodies: ArticleCache | None = None,
+        body_top_k: int = BACKLOG_BODY_TOP_K,
+    ):
+        self.path = path
+        self.half_life_hours = half_life_hours
+        self.max_age_days = max_age_days
+        self.max_candidates = max_candidates
+        self.bodies = bodies
+        self.body_top_k = body_top_k
+        self._seen = {}
+        self._candidates = {}
+        self._added_at = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def is_new(self, feed_url: str, guid: str) -> bool:
+        with self._lock:
+            return guid not in self._seen.get(feed_url, {})
+
+    def mark_seen(self, feed_url: str, guids: Iterable[str]) -> None:
+        now = CLOCK.time()
+        with self._lock:
+            seen = self._seen.setdefault(feed_url, {})
+            for guid in guids:
+                seen.setdefault(guid, now)
+            if len(seen) > BACKLOG_SEEN_PER_FEED:
+                newest = sorted(seen.items(), key=lambda pair: pair[1])[-BACKLOG_SEEN_PER_FEED:]
+                self._seen[feed_url] = dict(newest)
+
+    def add(self, entries: Iterable[tuple[ResearchEntry, float | None]]) -> None:
+        """Add (entry, published unix time) pairs as candidates."""
+        now = CLOCK.time()
+        with self._lock:
+            for entry, published_at in entries:
+                if entry.item_id not in self._candidates:
+                    self._added_at[entry.item_id] = min(published_at or now, now)
+                self._candidates[entry.item_id] = entry
+            if len(self._candidates) > 2 * self.max_candidates:
+                self._trim(now)
+
+    def discard(self, item_ids: Iterable[str]) -> None:
+        with self._lock:
+            for item_id in item_ids:
+                self._candidates.pop(item_id, None)
+                self._added_at.pop(item_id, None)
+
+    def _decayed_score(self, item_id: str, now: float) -> float:
+        age_hours = max(0.0, now - self._added_at.get(item_id, now)) / 3600
+        return self._candidates[item_id].score * 0.5 ** (age_hours / self.half_life_hours)
+
+    def ranked(self, posted_items: Container[str] = ()) -> list[ResearchEntry]:
+        """Drop expired and posted candidates, then return the rest best-first."""
+        now = CLOCK.time()
+        cutoff = now - self.max_age_days * 86400 if self.max_age_days is not None else float("-inf")
+        with self._lock:
+            for item_id in list(self._candidates):
+                if self._added_at.get(item_id, now) < cutoff or item_id in posted_items:
+                    self._candidates.pop(item_id, None)
+                    self._added_at.pop(item_id, None)
+
+            self._trim(now)
+            return list(self._candidates.values())
+
+    def _trim(self, now: float) -> None:
+        """Keep the best ``max_candidates`` best-first and spill bodies below the top ``body_top_k``."""
+        best = heapq.nlargest(
+            self.max_candidates,
+            self._candidates,
+            key=lambda item_id: self._decayed_score(item_id, now),
         )
-        response.raise_for_status()
+        self._candidates = {item_id: self._candidates[item_id] for item_id in best}
+        self._added_at = {item_id: self._added_at[item_id] for item_id in best}
+        if self.bodies is None:
+            return
+        for entry in islice(self._candidates.values(), self.body_top_k, None):
+            if entry.content:
+                self.bodies.put(entry.item_id, entry.content[:BACKLOG_CONTENT_CHARS])
+                entry.content = NormalizedText()
+
+    def _load(self) -> None:
+        if not self.path:
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (json.JSONDecodeError, OSError):
+            return
+        if not isinstance(data, dict):
+            return
+
+        self._seen = {url: dict(seen) for url, seen in data.get("seen", {}).items() if isinstance(seen, dict)}
+        for item in data.get("candidates", []):
+            try:
+                added_at = item.pop("added_at")
+                item["fingerprint"] = tuple(item.get("fingerprint", ()))
+                # Feed names and focus lines repeat for every candidate from a feed.
+                item["source"] = sys.intern(item["source"])
+                item["focus"] = sys.intern(item["focus"])
+                entry = ResearchEntry(**item)
+            except (KeyError, TypeError):
+                continue
+            entry.summary = NormalizedText(entry.summary)
+            entry.content = NormalizedText(entry.content)
+            self._candidates[entry.item_id] = entry
+            self._added_at[entry.item_id] = added_at
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            candidates = []
+            for item_id, entry in self._candidates.items():
+                item = asdict(entry)
+                item["content"] = item["content"][:BACKLOG_CONTENT_CHARS]
+                item["fingerprint"] = list(entry.fingerprint)
+                item["added_at"] = self._added_at.get(item_id, CLOCK.time())
+                candidates.append(item)
+            data = {"seen": self._seen, "candidates": candidates}
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        if self.bodies is not None:
+            self.bodies.evict()
+
+
+class FeedHealthStore:
+    """Per-feed poll history that decides when each feed is worth polling again.
+
+    Every poll updates the feed's success and failure streaks, smoothed
+    latency, observed publish interval and yield of strong entries. A healthy
+    feed is due again after about half its publish interval, sooner when it
+    keeps yielding strong entries and later when it is slow. A feed that has
+    shown nothing newer for several publish intervals backs off exponentially
+    up to two days, a failing one up to a week, and one good poll brings it
+    back to its normal pace. ``path=None``
+    keeps the records in memory; with ``adaptive=False`` every feed is due.
+    """
+
+    def __init__(self, path: str | None = FEED_HEALTH_FILE, adaptive: bool = True):
+        self.path = path
+        self.adaptive = adaptive
+        self._records = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict:
+        if self._records is not None:
+            return self._records
+
+        self._records = {}
+        if not self.path:
+            return self._records
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (json.JSONDecodeError, OSError):
+            return self._records
+        if isinstance(data, dict):
+            self._records = {url: record for url, record in data.items() if isinstance(record, dict)}
+        return self._records
+
+    def _record(self, url: str) -> dict:
+        return self._load().setdefault(
+            url,
+            {
+                "successes": 0,
+                "failures": 0,
+                "failure_streak": 0,
+                "empty_streak": 0,
+                "latency": None,
+                "publish_interval": None,
+                "yield": 0.0,
+                "newest_published": None,
+                "last_polled": None,
+                "next_poll": 0.0,
+            },
+        )
+
+    def due_feeds(self, feeds: list[dict], now: float | None = None) -> list[dict]:
+        """The feeds whose next poll time has come, printing what is skipped."""
+        if not self.adaptive:
+            return feeds
+        now = CLOCK.time() if now is None else now
+        with self._lock:
+            records = self._load()
+            waiting = [
+                (records[feed_config["url"]]["next_poll"], feed_config)
+                for feed_config in feeds
+                if feed_config["url"] in records and records[feed_config["url"]].get("next_poll", 0) > now
+            ]
+        if not waiting:
+            return feeds
+
+        METRICS.inc("feeds_not_due", len(waiting))
+        next_poll, next_feed = min(waiting, key=lambda pair: pair[0])
+        print(
+            f"Polling {len(feeds) - len(waiting)} of {len(feeds)} feeds; {len(waiting)} not due yet "
+            f"(next: {next_feed['name']} in {(next_poll - now) / 3600:.1f} h)"
+        )
+        skipped = {id(feed_config) for _, feed_config in waiting}
+        return [feed_config for feed_config in feeds if id(feed_config) not in skipped]
+
+    def record_failure(self, url: str, seconds: float) -> None:
+        now = CLOCK.time()
+        with self._lock:
+            record = self._record(url)
+            record["failures"] += 1
+            record["failure_streak"] += 1
+            record["latency"] = self._smooth(record["latency"], seconds)
+            record["last_polled"] = now
+            record["next_poll"] = now + self._interval(record)
+            self._dirty = True
+
+    def record_success(
+        self, url: str, seconds: float, raw_entries: list[dict], new_entries: int, strong_entries: int
+    ) -> None:
+        now = CLOCK.time()
+        published = sorted((item["published_at"] for item in raw_entries if item.get("published_at")), reverse=True)
+        with self._lock:
+            record = self._record(url)
+            record["successes"] += 1
+            record["failure_streak"] = 0
+            record["latency"] = self._smooth(record["latency"], seconds)
+            record["yield"] = self._smooth(record["yield"], float(strong_entries))
+
+            newer = published and (record["newest_published"] is None or published[0] > record["newest_published"])
+            if newer:
+                record["newest_published"] = published[0]
+            record["empty_streak"] = 0 if newer or new_entries else record["empty_streak"] + 1
+            gaps = [later - earlier for later, earlier in zip(published, published[1:]) if later > earlier]
+            if gaps:
+                record["publish_interval"] = self._smooth(record["publish_interval"], sorted(gaps)[len(gaps) // 2])
+
+            record["last_polled"] = now
+            record["next_poll"] = now + self._interval(record)
+            self._dirty = True
+
+    @staticmethod
+    def _smooth(previous: float | None, value: float) -> float:
+        if previous is None:
+            return value
+        return previous + FEED_HEALTH_SMOOTHING * (value - previous)
+
+    @staticmethod
+    def _interval(record: dict) -> float:
+        if record["failure_streak"]:
+            return min(FEED_BACKOFF_MAX_SECONDS, FEED_POLL_MIN_SECONDS * 2 ** record["failure_streak"])
+
+        publish_interval = record["publish_interval"] or FEED_POLL_MIN_SECONDS
+        interval = publish_interval / 2 / (1 + record["yield"])
+        if (record["latency"] or 0) > FEED_SLOW_SECONDS:
+            interval *= 2
+        # Nothing newer for several publish intervals: the feed has probably
+        # gone quiet, but it is still looked at every couple of days.
+        newest = record["newest_published"]
+        if newest and record["last_polled"] - newest > 3 * publish_interval:
+            interval *= 2 ** min(record["empty_streak"], 8)
+        return min(max(interval, FEED_POLL_MIN_SECONDS), FEED_POLL_MAX_SECONDS)
+
+    def save(self) -> None:
+        with self._lock:
+            if not self.path or not self._dirty or self._records is None:
+                return
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as file:
+                json.dump(self._records, file)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+
+class EngagementStore:
+    """Like, repost, reply and quote counts for our published posts, kept in SQLite.
+
+    Each thread is stored with its source and matched keywords. Posts are
+    indexed by publish time, so choosing which ones to re-check only reads
+    recent rows no matter how long the history grows. The database is opened
+    on first use.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS threads (
+            item_id TEXT PRIMARY KEY,
+            source TEXT NOT NULL,
+            posted_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS thread_keywords (
+            item_id TEXT NOT NULL,
+            keyword TEXT NOT NULL,
+            PRIMARY KEY (item_id, keyword)
+        );
+        CREATE INDEX IF NOT EXISTS thread_keywords_keyword ON thread_keywords (keyword);
+        CREATE TABLE IF NOT EXISTS posts (
+            uri TEXT PRIMARY KEY,
+            item_id TEXT NOT NULL,
+            posted_at REAL NOT NULL,
+            checked_at REAL,
+            likes INTEGER NOT NULL DEFAULT 0,
+            reposts INTEGER NOT NULL DEFAULT 0,
+            replies INTEGER NOT NULL DEFAULT 0,
+            quotes INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS posts_posted_at ON posts (posted_at);
+        CREATE INDEX IF NOT EXISTS posts_item_id ON posts (item_id);
+    """
+
+    # One engagement point per like; reposts, replies and quotes spread a post further.
+    THREAD_SCORE_SQL = "SUM(p.likes + 2 * (p.reposts + p.replies + p.quotes))"
+
+    def __init__(self, path: str = ENGAGEMENT_DB_FILE, matcher: KeywordMatcher = KEYWORD_MATCHER):
+        self.path = path
+        self.matcher = matcher
+        self._db = None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            self._db = sqlite3.connect(self.path)
+            self._db.executescript(self.SCHEMA)
+        return self._db
+
+    def exists(self) -> bool:
+        return self._db is not None or os.path.exists(self.path)
+
+    def record_thread(self, entry: ResearchEntry, uris: list[str], posted_at: float | None = None) -> None:
+        if not uris:
+            return
+        posted_at = CLOCK.time() if posted_at is None else posted_at
+        keywords = self.matcher.hits(" ".join([entry.title, entry.summary, entry.content, entry.focus]))
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO threads (item_id, source, posted_at) VALUES (?, ?, ?)",
+                (entry.item_id, entry.source, posted_at),
+            )
+            self.db.executemany(
+                "INSERT OR IGNORE INTO thread_keywords (item_id, keyword) VALUES (?, ?)",
+                [(entry.item_id, keyword) for keyword in keywords],
+            )
+            self.db.executemany(
+                "INSERT OR IGNORE INTO posts (uri, item_id, posted_at) VALUES (?, ?, ?)",
+                [(uri, entry.item_id, posted_at) for uri in uris],
+            )
+
+    def due_posts(self, now: float | None = None) -> list[str]:
+        """URIs of posts young enough to still gain engagement and not checked recently."""
+        now = CLOCK.time() if now is None else now
+        settled_age = ENGAGEMENT_CHECK_SCHEDULE[-1][0]
+        rows = self.db.execute(
+            "SELECT uri, posted_at, checked_at FROM posts WHERE posted_at > ? ORDER BY posted_at",
+            (now - settled_age,),
+        )
+        due = []
+        for uri, posted_at, checked_at in rows:
+            age = now - posted_at
+            interval = next(interval for max_age, interval in ENGAGEMENT_CHECK_SCHEDULE if age < max_age)
+            if checked_at is None or now - checked_at >= interval:
+                due.append(uri)
+        return due
+
+    def update_counts(self, uris: list[str], posts: dict[str, dict], checked_at: float | None = None) -> None:
+        """Store counts from getPosts views. URIs missing from ``posts`` were deleted and are only marked checked."""
+        checked_at = CLOCK.time() if checked_at is None else checked_at
+        with self.db:
+            for uri in uris:
+                post = posts.get(uri)
+                if post is None:
+                    self.db.execute("UPDATE posts SET checked_at = ? WHERE uri = ?", (checked_at, uri))
+                    continue
+                self.db.execute(
+                    "UPDATE posts SET checked_at = ?, likes = ?, reposts = ?, replies = ?, quotes = ? WHERE uri = ?",
+                    (
+                        checked_at,
+                        int(post.get("likeCount", 0)),
+                        int(post.get("repostCount", 0)),
+                        int(post.get("replyCount", 0)),
+                        int(post.get("quoteCount", 0)),
+                        uri,
+                    ),
+                )
+
+    def aggregates(self, min_threads: int = ENGAGEMENT_MIN_THREADS) -> tuple[float, dict, dict]:
+        """Mean thread engagement overall, by source and by keyword.
+
+        Groups with fewer than ``min_threads`` checked threads are left out.
+        """
+        thread_scores = f"""
+            SELECT t.item_id, t.source, {self.THREAD_SCORE_SQL} AS score
+            FROM threads t JOIN posts p ON p.item_id = t.item_id
+            WHERE p.checked_at IS NOT NULL
+            GROUP BY t.item_id
+        """
+        baseline = self.db.execute(f"SELECT AVG(score) FROM ({thread_scores})").fetchone()[0] or 0.0
+        sources = {
+            source: (count, mean)
+            for source, count, mean in self.db.execute(
+                f"SELECT source, COUNT(*), AVG(score) FROM ({thread_scores}) GROUP BY source HAVING COUNT(*) >= ?",
+                (min_threads,),
+            )
+        }
+        keywords = {
+            keyword: (count, mean)
+            for keyword, count, mean in self.db.execute(
+                f"""
+                SELECT k.keyword, COUNT(*), AVG(s.score)
+                FROM ({thread_scores}) s JOIN thread_keywords k ON k.item_id = s.item_id
+                GROUP BY k.keyword HAVING COUNT(*) >= ?
+                """,
+                (min_threads,),
+            )
+        }
+        return baseline, sources, keywords
+
+
+class EngagementWeights:
+    """Score bonuses learned from how earlier threads did, by source and keyword.
+
+    A group that averages twice the overall engagement earns the full bonus,
+    and one with none earns the full penalty. Bonuses are zero until ``load``
+    reads a store.
+    """
+
+    def __init__(self):
+        self.sources = {}
+        self.keywords = {}
+
+    def load(self, store: EngagementStore) -> None:
+        if not store.exists():
+            return
+        baseline, sources, keywords = store.aggregates()
+        if not baseline:
+            return
+        self.sources = {
+            source: self._bonus(mean / baseline, ENGAGEMENT_SOURCE_MAX_BONUS) for source, (_, mean) in sources.items()
+        }
+        self.keywords = {
+            keyword: self._bonus(mean / baseline, ENGAGEMENT_KEYWORD_MAX_BONUS)
+            for keyword, (_, mean) in keywords.items()
+        }
+        print(f"Engagement weights: {len(self.sources)} sources, {len(self.keywords)} keywords")
+
+    @staticmethod
+    def _bonus(ratio: float, limit: int) -> int:
+        return max(-limit, min(limit, round(limit * (ratio - 1))))
+
+    def bonus(self, source: str, keywords: Iterable[str]) -> int:
+        keyword_bonus = sum(self.keywords.get(keyword, 0) for keyword in keywords)
+        keyword_limit = 3 * ENGAGEMENT_KEYWORD_MAX_BONUS
+        return self.sources.get(source, 0) + max(-keyword_limit, min(keyword_limit, keyword_bonus))
+
+
+def download_feed(feed_config: dict, is_seen=None) -> list[dict] | None:
+    """Fetch and parse one feed into compact entries, or None if the request failed."""
+    url = feed_config["url"]
+    feed_name = feed_config["name"]
+    try:
+        with METRICS.timer("feed_fetch_seconds", feed=feed_name):
+            response = HTTP.get(url, headers=HTTP_CACHE.request_headers(url), stream=True)
+            with response:
+                response.raise_for_status()
+                raw_entries = HTTP_CACHE.reuse(url) if response.status_code == 304 else None
+                if raw_entries is None:
+                    raw_entries, received = read_feed_entries(response, feed_name, is_seen)
+                    METRICS.inc("feed_bytes", received, feed=feed_name)
+                    HTTP_CACHE.store(url, response, raw_entries)
+                else:
+                    print("  not modified, using cached entries")
+                    METRICS.inc("feed_not_modified", feed=feed_name)
     except requests.RequestException as exc:
         print(f"  skipped: {exc}")
+        METRICS.inc("feed_errors", feed=feed_name)
+        return None
+
+    METRICS.inc("entries_parsed", len(raw_entries), feed=feed_name)
+    return raw_entries
+
+
+def fetch_feed_entries(
+    feed_config: dict,
+    backlog: CandidateBacklog | None = None,
+    account: "AccountProfile | None" = None,
+    health: FeedHealthStore | None = None,
+) -> list[ResearchEntry]:
+    print(f"Fetching feed: {feed_config['name']}")
+    url = feed_config["url"]
+    is_seen = None if backlog is None else lambda guid: not backlog.is_new(url, guid)
+    started = time.perf_counter()
+    raw_entries = download_feed(feed_config, is_seen)
+    elapsed = time.perf_counter() - started
+    if raw_entries is None:
+        if health is not None:
+            health.record_failure(url, elapsed)
         return []
+    entries = score_feed_entries(feed_config, raw_entries, backlog, account)
+    if health is not None:
+        strong = sum(1 for entry in entries if entry.score >= STRONG_ENTRY_SCORE)
+        health.record_success(url, elapsed, raw_entries, len(entries), strong)
+    return entries
 
-    feed = feedparser.parse(response.content)
-    if not feed.entries:
+
+def score_feed_entries(
+    feed_config: dict,
+    raw_entries: list[dict],
+    backlog: CandidateBacklog | None = None,
+    account: "AccountProfile | None" = None,
+    prepared: dict | None = None,
+) -> list[ResearchEntry]:
+    """Score parsed entries against one account's keywords and add new ones to its backlog.
+
+    ``prepared`` caches the normalized text and fingerprint per GUID, so
+    accounts that share a feed only pay for their own keyword scan.
+    """
+    account = account or DEFAULT_ACCOUNT
+    url = feed_config["url"]
+    feed_name = feed_config["name"]
+    prepared = {} if prepared is None else prepared
+    if not raw_entries:
         print("  skipped: no entries found")
         return []
 
     entries = []
-    for raw_entry in feed.entries[:8]:
-        title = normalize_text(raw_entry.get("title", ""))
-        link = raw_entry.get("link", "").strip()
-        if not title or not link:
+    already_seen = 0
+    for raw_entry in raw_entries:
+        guid = raw_entry.get("id") or raw_entry.get("link", "")
+        if backlog is not None and not backlog.is_new(url, guid):
+            already_seen += 1
+            continue
+
+        if guid not in prepared:
+            prepared[guid] = prepare_feed_entry(raw_entry)
+        if prepared[guid] is None:
             continue
+        title, link, summary, content, item_id, fingerprint = prepared[guid]
 
-        summary, content = clean_feed_content(raw_entry)
         combined = " ".join([title, summary, content, feed_config["focus"]])
-        score = score_text(combined, feed_config.get("weight", 0))
-
-        entries.append(
-            ResearchEntry(
-                title=title,
-                link=link,
-                source=feed_config["name"],
-                focus=feed_config["focus"],
-                published=raw_entry.get("published", ""),
-                summary=summary,
-                content=content,
-                item_id=get_item_id(title, link),
-                score=score,
-            )
+        score, hits = account.matcher.score(combined, feed_config.get("weight", 0))
+        score += account.weights.bonus(feed_name, hits)
+
+        entry = ResearchEntry(
+            title=title,
+            link=link,
+            source=feed_config["name"],
+            focus=feed_config["focus"],
+            published=raw_entry.get("published", ""),
+            summary=summary,
+            content=content,
+            item_id=item_id,
+            score=score,
+            fingerprint=fingerprint,
         )
-
-    print(f"  found {len(entries)} usable entries")
+        entries.append(entry)
+        if backlog is not None:
+            backlog.add([(entry, raw_entry.get("published_at"))])
+
+    METRICS.inc("entries_scored", len(entries), feed=feed_name)
+    prefix = "" if account is DEFAULT_ACCOUNT else f"[{account.name}] "
+    if backlog is not None:
+        backlog.mark_seen(url, [raw_entry.get("id") or raw_entry.get("link", "") for raw_entry in raw_entries])
+        print(f"  {prefix}found {len(entries)} new entries ({already_seen} already seen)")
+    else:
+        print(f"  {prefix}found {len(entries)} usable entries")
     return entries
 
 
-def fetch_research_entries() -> list[ResearchEntry]:
-    all_entries = []
-    for feed_config in RSS_FEEDS:
-        all_entries.extend(fetch_feed_entries(feed_config))
+def prepare_feed_entry(raw_entry: dict) -> tuple | None:
+    """Normalized title, link, summary, content, item ID and fingerprint, or None if unusable."""
+    title = normalize_text(raw_entry.get("title", ""))
+    link = raw_entry.get("link", "").strip()
+    if not title or not link:
+        return None
+    summary, content = clean_feed_content(raw_entry)
+    return title, link, summary, content, get_item_id(title, link), story_fingerprint(title, summary, content)
+
+
+@timed_stage("fetch_research_entries")
+def fetch_research_entries(
+    feeds: list[dict] | None = None,
+    workers: int = FETCH_WORKERS,
+    deadline: float = FETCH_DEADLINE,
+    backlog: CandidateBacklog | None = None,
+    fetch=None,
+    health: FeedHealthStore | None = None,
+) -> int:
+    """Fetch and score every feed into ``backlog`` and return how many new entries were found.
+
+    ``fetch(feed_config)`` replaces ``fetch_feed_entries`` when given. Each
+    feed's entry list is dropped as soon as it is counted, so memory does not
+    grow with the number of feeds; candidates are ranked from the backlog.
+    With ``health``, only feeds that are due are polled and each poll is recorded.
+    """
+    feeds = RSS_FEEDS if feeds is None else feeds
+    if health is not None:
+        feeds = health.due_feeds(feeds)
+    fetch = fetch or (lambda feed_config: fetch_feed_entries(feed_config, backlog, health=health))
+    if workers <= 1:
+        found = sum(len(fetch(feed_config)) for feed_config in feeds)
+    else:
+        found = fetch_feeds_concurrently(feeds, workers, deadline, fetch)
 
-    all_entries.sort(key=lambda entry: entry.score, reverse=True)
-    return all_entries
+    print(f"\nFound {found} new research entries")
+    return found
 
 
-def fetch_article_text(url: str) -> str:
-    try:
-        response = requests.get(
-            url,
-            headers={"User-Agent": USER_AGENT},
-            timeout=REQUEST_TIMEOUT,
-        )
-        response.raise_for_status()
-    except requests.RequestException:
-        return ""
+def fetch_feeds_concurrently(feeds: list[dict], workers: int, deadline: float, fetch) -> int:
+    """Run ``fetch(feed_config)`` on a bounded pool, capping requests per host and overall time.
 
-    content_type = response.headers.get("content-type", "")
-    if "html" not in content_type.lower():
-        return ""
+    Returns the number of entries the finished feeds produced.
+    """
+    host_limits = {}
+    for feed_config in feeds:
+        host = urlsplit(feed_config["url"]).netloc.lower()
+        host_limits.setdefault(host, threading.BoundedSemaphore(FETCH_PER_HOST_LIMIT))
 
-    parser = ArticleTextExtractor()
+    def fetch_with_host_limit(feed_config: dict) -> list[ResearchEntry]:
+        host = urlsplit(feed_config["url"]).netloc.lower()
+        with host_limits[host]:
+            return fetch(feed_config)
+
+    executor = ThreadPoolExecutor(max_workers=min(workers, len(feeds)) or 1)
+    pending = {executor.submit(fetch_with_host_limit, feed): feed for feed in feeds}
+    found = 0
     try:
-        parser.feed(response.text)
-    except Exception:
+        # Count each feed as it finishes so its entry list can be freed right away.
+        for future in as_completed(list(pending), timeout=deadline):
+            feed_config = pending.pop(future)
+            try:
+                found += len(future.result())
+            except Exception as exc:
+                print(f"Feed {feed_config['name']} failed: {exc}")
+                METRICS.inc("feed_errors", feed=feed_config["name"])
+    except FuturesTimeoutError:
+        pass
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    if pending:
+        names = ", ".join(feed_config["name"] for feed_config in pending.values())
+        print(f"Timed out after {deadline}s waiting for: {names}")
+        for feed_config in pending.values():
+            METRICS.inc("feed_timeouts", feed=feed_config["name"])
+    return found
+
+
+META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9._:-]+)""", re.IGNORECASE)
+
+
+def detect_charset(content_type: str, head: bytes) -> str:
+    """Pick the page encoding from the header, then a <meta> tag, else UTF-8."""
+    candidates = []
+    header_match = re.search(r"charset=[\"']?([A-Za-z0-9._:-]+)", content_type, re.IGNORECASE)
+    if header_match:
+        candidates.append(header_match.group(1))
+    if head.startswith(codecs.BOM_UTF8):
+        candidates.insert(0, "utf-8-sig")
+    meta_match = META_CHARSET_RE.search(head)
+    if meta_match:
+        candidates.append(meta_match.group(1).decode("ascii", "ignore"))
+
+    for candidate in candidates:
+        try:
+            return codecs.lookup(candidate).name
+        except LookupError:
+            continue
+    return "utf-8"
+
+
+@timed_stage("fetch_article_text")
+def fetch_article_text(
+    url: str,
+    max_bytes: int = ARTICLE_MAX_BYTES,
+    text_target: int = ARTICLE_TEXT_TARGET,
+    conditional: bool = True,
+) -> str:
+    """Stream an article page into the extractor, stopping at a byte or text cap.
+
+    The text goes into ``ARTICLE_CACHE`` with the response's validators. With
+    ``conditional``, a stored copy is revalidated and reused on a 304.
+    """
+    headers = ARTICLE_CACHE.request_headers(url) if conditional else {}
+    try:
+        response = HTTP.get(url, headers=headers, stream=True)
+    except requests.RequestException:
         return ""
 
-    return parser.text()
+    with response:
+        try:
+            response.raise_for_status()
+        except requests.RequestException:
+            return ""
+        if response.status_code == 304:
+            cached_text = ARTICLE_CACHE.revalidate(url)
+            return NormalizedText(cached_text) if cached_text is not None else ""
+
+        content_type = response.headers.get("content-type", "")
+        if "html" not in content_type.lower():
+            return ""
+
+        parser = ArticleTextExtractor()
+        decoder = None
+        received = 0
+        try:
+            for chunk in response.iter_content(chunk_size=ARTICLE_CHUNK_SIZE):
+                if decoder is None:
+                    encoding = detect_charset(content_type, chunk[:4096])
+                    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+                received += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                if received >= max_bytes or parser.captured_chars >= text_target:
+                    break
+            if decoder is not None:
+                parser.feed(decoder.decode(b"", final=True))
+            parser.close()
+        except Exception:
+            return ""
+        METRICS.observe("article_bytes", received, buckets=BYTES_BUCKETS, host=urlsplit(url).netloc.lower())
+
+    text = parser.text()
+    if text:
+        ARTICLE_CACHE.put(url, text, response.headers.get("ETag", ""), response.headers.get("Last-Modified", ""))
+    return text
+
+
+def get_article_text(url: str, use_cache: bool = True) -> str:
+    """Article text from ``ARTICLE_CACHE``, revalidating expired copies; ``use_cache=False`` fetches in full."""
+    if use_cache:
+        cached_text = ARTICLE_CACHE.get(url)
+        if cached_text is not None:
+            return NormalizedText(cached_text)
+    return fetch_article_text(url, conditional=use_cache)
 
 
 def split_sentences(text: str) -> list[str]:
@@ -399,38 +2375,125 @@ def split_sentences(text: str) -> list[str]:
     if not cleaned:
         return []
 
-    pieces = re.split(r"(?<=[.!?])\s+", cleaned)
+    pieces = SENTENCE_SPLIT_RE.split(cleaned)
     return [piece.strip() for piece in pieces if piece.strip()]
 
 
-def is_noise_sentence(sentence: str) -> bool:
-    lowered = sentence.lower()
-    if len(sentence) < 45 or len(sentence) > 260:
-        return True
-    return any(phrase in lowered for phrase in NOISE_PHRASES)
+def noise_sentence_flags(sentences: list[str]) -> list[bool]:
+    """Flag sentences that are too short, too long or contain a ``NOISE_PHRASES`` entry.
+
+    Each phrase is searched once across all the sentences.
+    """
+    flags = [len(sentence) < SENTENCE_MIN_CHARS or len(sentence) > SENTENCE_MAX_CHARS for sentence in sentences]
+    corpus, starts = lowered_corpus(sentences)
+    for phrase in NOISE_PHRASES:
+        position = corpus.find(phrase)
+        while position != -1:
+            index = bisect.bisect_right(starts, position) - 1
+            flags[index] = True
+            if index + 1 == len(starts):
+                break
+            position = corpus.find(phrase, starts[index + 1])
+    return flags
+
+
+class SentenceRanker:
+    """Ranks candidate sentences from many articles in one batch.
+
+    Every sentence in the batch goes through a single keyword scan. Keyword
+    weights are scaled by BM25 IDF across the batch, so terms that most
+    sentences mention count for less, and by BM25 length normalization.
+    Picks for an article skip sentences whose word-set cosine similarity to
+    an earlier pick is above ``diversity``.
+    """
+
+    def __init__(
+        self,
+        matcher: KeywordMatcher,
+        k1: float = BM25_K1,
+        b: float = BM25_B,
+        diversity: float = SENTENCE_DIVERSITY_SIMILARITY,
+    ):
+        self.matcher = matcher
+        self.k1 = k1
+        self.b = b
+        self.diversity = diversity
+
+    def rank(self, texts: list[str], limit: int = 2) -> list[list[str]]:
+        """Return up to ``limit`` sentences for each text, best first."""
+        sentences = []
+        owners = []
+        for index, text in enumerate(texts):
+            split = split_sentences(text)
+            sentences.extend(split)
+            owners.extend([index] * len(split))
+        noise = noise_sentence_flags(sentences)
+        sentences = [sentence for sentence, noisy in zip(sentences, noise) if not noisy]
+        owners = [owner for owner, noisy in zip(owners, noise) if not noisy]
+
+        picks = [[] for _ in texts]
+        if not sentences:
+            return picks
+
+        scores = self.scores(sentences)
+        picked_words = [[] for _ in texts]
+        for index in sorted(range(len(sentences)), key=lambda index: scores[index], reverse=True):
+            owner = owners[index]
+            if len(picks[owner]) == limit:
+                continue
+            words = self._words(sentences[index])
+            if any(self._cosine(words, other) > self.diversity for other in picked_words[owner]):
+                continue
+            picks[owner].append(sentences[index])
+            picked_words[owner].append(words)
+        return picks
+
+    def scores(self, sentences: list[str]) -> list[float]:
+        hits = self.matcher.hits_many(sentences)
+        document_frequency = {}
+        for terms in hits:
+            for term in terms:
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+
+        count = len(sentences)
+        term_weights = {
+            term: self.matcher.weights[term] * math.log(1 + (count - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequency.items()
+        }
+        lengths = [len(sentence.split()) for sentence in sentences]
+        average_length = sum(lengths) / count
+        return [
+            sum(term_weights[term] for term in terms)
+            * (self.k1 + 1)
+            / (1 + self.k1 * (1 - self.b + self.b * length / average_length))
+            for terms, length in zip(hits, lengths)
+        ]
+
+    @staticmethod
+    def _words(sentence: str) -> frozenset[str]:
+        return frozenset(
+            word for word in FINGERPRINT_WORD_RE.findall(sentence.lower()) if word not in FINGERPRINT_STOPWORDS
+        )
 
+    @staticmethod
+    def _cosine(left: frozenset[str], right: frozenset[str]) -> float:
+        if not left or not right:
+            return 0.0
+        return len(left & right) / math.sqrt(len(left) * len(right))
 
-def choose_best_sentences(text: str, limit: int = 2) -> list[str]:
-    candidates = []
-    for sentence in split_sentences(text):
-        if is_noise_sentence(sentence):
-            continue
-        candidates.append((score_text(sentence), sentence))
 
-    candidates.sort(key=lambda item: item[0], reverse=True)
-    selected = []
-    seen_stems = set()
+SENTENCE_RANKER = SentenceRanker(KEYWORD_MATCHER)
 
-    for _, sentence in candidates:
-        stem = " ".join(sentence.lower().split()[:8])
-        if stem in seen_stems:
-            continue
-        selected.append(sentence)
-        seen_stems.add(stem)
-        if len(selected) == limit:
-            break
 
-    return selected
+@timed_stage("choose_best_sentences")
+def choose_best_sentences(text: str, limit: int = 2, ranker: SentenceRanker | None = None) -> list[str]:
+    return (ranker or SENTENCE_RANKER).rank([text], limit)[0]
+
+
+@timed_stage("rank_sentences")
+def rank_sentences(texts: list[str], limit: int = 2, ranker: SentenceRanker | None = None) -> list[list[str]]:
+    """``choose_best_sentences`` for many articles, weighting terms across all of them."""
+    return (ranker or SENTENCE_RANKER).rank(texts, limit)
 
 
 def make_creator_action(title: str, text: str) -> str:
@@ -531,11 +2594,29 @@ def pack_insights(insights: list[str], prefix: str) -> str:
     return trim_to_limit(insights[0], budget)
 
 
-def build_thread(entry: ResearchEntry) -> list[str]:
-    article_text = fetch_article_text(entry.link)
-    research_text = normalize_text(" ".join([entry.content, entry.summary, article_text]))
-    insights = choose_best_sentences(research_text, limit=2)
+def research_text_for(
+    entry: ResearchEntry, use_cache: bool = True, bodies: ArticleCache | None = None
+) -> NormalizedText:
+    """Feed content, summary and article text; content spilled by the backlog is read back from ``bodies``."""
+    content = entry.content or (bodies.get(entry.item_id) if bodies else None) or ""
+    article_text = get_article_text(entry.link, use_cache=use_cache)
+    return join_normalized([content, entry.summary, article_text])
+
+
+@timed_stage("build_thread")
+def build_thread(entry: ResearchEntry, use_cache: bool = True, account: "AccountProfile | None" = None) -> list[str]:
+    account = account or DEFAULT_ACCOUNT
+    research_text = research_text_for(entry, use_cache, account.bodies)
+    insights = choose_best_sentences(research_text, limit=2, ranker=account.ranker)
+    return compose_thread(entry, research_text, insights, account.template)
 
+
+def compose_thread(
+    entry: ResearchEntry,
+    research_text: str,
+    insights: list[str],
+    template: ThreadTemplate = ThreadTemplate(),
+) -> list[str]:
     if not insights:
         fallback = entry.summary or entry.content or entry.focus
         insights = [trim_to_limit(fallback, 220)]
@@ -544,28 +2625,173 @@ def build_thread(entry: ResearchEntry) -> list[str]:
     title = trim_to_limit(entry.title, 190)
 
     post_1 = fit_template(
-        "Creator growth research:\n\n",
+        template.hook,
         f"{title}\n\nWhy it matters: {entry.focus}.",
     )
 
-    post_2_prefix = "Useful signal:\n\n"
-    post_2 = fit_template(post_2_prefix, pack_insights(insights, post_2_prefix))
+    post_2 = fit_template(template.signal, pack_insights(insights, template.signal))
 
-    post_3 = fit_template("Creator move:\n\n", action)
+    post_3 = fit_template(template.action, action)
 
     source_prefix = f"Source: {entry.source}\n"
-    hashtags = "\n\n#ContentCreator #CreatorEconomy #AudienceGrowth"
-    post_4 = fit_template(source_prefix, entry.link, hashtags)
+    post_4 = fit_template(source_prefix, entry.link, template.hashtags)
 
     return [post_1, post_2, post_3, post_4]
 
 
+def build_threads(
+    entries: list[ResearchEntry],
+    workers: int = BUILD_WORKERS,
+    use_cache: bool = True,
+    account: "AccountProfile | None" = None,
+) -> list[list[str]]:
+    """Build threads for several entries at once, returned in entry order.
+
+    Articles are fetched concurrently, then their sentences are ranked in one batch.
+    """
+    account = account or DEFAULT_ACCOUNT
+    if workers <= 1 or len(entries) <= 1:
+        texts = [research_text_for(entry, use_cache, account.bodies) for entry in entries]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(entries))) as executor:
+            texts = list(executor.map(lambda entry: research_text_for(entry, use_cache, account.bodies), entries))
+
+    insights = rank_sentences(texts, limit=2, ranker=account.ranker)
+    return [
+        compose_thread(entry, text, picks, account.template) for entry, text, picks in zip(entries, texts, insights)
+    ]
+
+
+@dataclass
+class AccountProfile:
+    """One Bluesky account: its feeds, keywords, thread template, credentials and state files.
+
+    Credentials come from the environment variables named here, never from
+    the accounts file. State files use their usual names inside ``state_dir``.
+    """
+
+    name: str
+    feeds: list[dict]
+    matcher: KeywordMatcher = KEYWORD_MATCHER
+    template: ThreadTemplate = ThreadTemplate()
+    handle_env: str = "BLUESKY_HANDLE"
+    password_env: str = "BLUESKY_APP_PASSWORD"
+    state_dir: str = ""
+    threads_per_run: int = DEFAULT_THREADS_PER_RUN
+
+    def __post_init__(self):
+        self.ranker = SENTENCE_RANKER if self.matcher is KEYWORD_MATCHER else SentenceRanker(self.matcher)
+        self.engagement = EngagementStore(self.path(ENGAGEMENT_DB_FILE), self.matcher)
+        body_age = BACKLOG_MAX_AGE_DAYS * 24 * 60 * 60
+        self.bodies = ArticleCache(self.path(CANDIDATE_BODY_DIR), ttl=body_age, max_age=body_age)
+        self.weights = EngagementWeights()
+
+    def path(self, filename: str) -> str:
+        if not self.state_dir:
+            return filename
+        return os.path.join(self.state_dir, os.path.basename(filename))
+
+
+DEFAULT_ACCOUNT = AccountProfile("default", RSS_FEEDS)
+
+
+def load_accounts(path: str) -> list[AccountProfile]:
+    """Read account profiles from a JSON file; see README "Several Accounts"."""
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+
+    accounts = []
+    for item in data.get("accounts", []):
+        name = item.get("name")
+        if not name:
+            raise ValueError("every account needs a name")
+        keywords = item.get("keywords")
+        matcher = KEYWORD_MATCHER
+        if keywords:
+            matcher = KeywordMatcher(
+                (keywords.get("positive", {}), keywords.get("action", {}), keywords.get("negative", {})),
+                word_boundaries=KEYWORD_WORD_BOUNDARIES,
+            )
+        feeds = item.get("feeds", RSS_FEEDS)
+        for feed_config in feeds:
+            if not feed_config.get("name") or not feed_config.get("url"):
+                raise ValueError(f"account {name}: every feed needs a name and url")
+            feed_config.setdefault("focus", "")
+        accounts.append(
+            AccountProfile(
+                name=name,
+                feeds=feeds,
+                matcher=matcher,
+                template=ThreadTemplate(**item.get("template", {})),
+                handle_env=item.get("handle_env", "BLUESKY_HANDLE"),
+                password_env=item.get("password_env", "BLUESKY_APP_PASSWORD"),
+                state_dir=item.get("state_dir", os.path.join("accounts", name)),
+                threads_per_run=int(item.get("threads_per_run", DEFAULT_THREADS_PER_RUN)),
+            )
+        )
+
+    names = [account.name for account in accounts]
+    if len(set(names)) != len(names):
+        raise ValueError("account names must be unique")
+    return accounts
+
+
+def fetch_for_accounts(
+    accounts: list[AccountProfile],
+    backlogs: dict[str, CandidateBacklog],
+    workers: int = FETCH_WORKERS,
+    deadline: float = FETCH_DEADLINE,
+    health: FeedHealthStore | None = None,
+) -> int:
+    """Fetch each unique feed URL once and score its entries into every subscribed account's backlog.
+
+    A feed stops streaming early only at items every subscribed account has
+    already seen. Normalizing and fingerprinting happen once per item; only
+    the keyword scan runs per account. Feed health is recorded per URL, with
+    the yield of the account that found the most strong entries. Returns the
+    number of new entries summed over accounts.
+    """
+    subscribers = {}
+    for account in accounts:
+        for feed_config in account.feeds:
+            subscribers.setdefault(feed_config["url"], []).append((account, feed_config))
+
+    def fetch(feed_config: dict) -> list[ResearchEntry]:
+        url = feed_config["url"]
+        accounts_for_feed = subscribers[url]
+        print(f"Fetching feed: {feed_config['name']} ({len(accounts_for_feed)} accounts)")
+
+        def is_seen(guid: str) -> bool:
+            return all(not backlogs[account.name].is_new(url, guid) for account, _ in accounts_for_feed)
+
+        started = time.perf_counter()
+        raw_entries = download_feed(feed_config, is_seen)
+        elapsed = time.perf_counter() - started
+        if raw_entries is None:
+            if health is not None:
+                health.record_failure(url, elapsed)
+            return []
+        prepared = {}
+        entries = []
+        new_entries = strong_entries = 0
+        for account, account_feed in accounts_for_feed:
+            scored = score_feed_entries(account_feed, raw_entries, backlogs[account.name], account, prepared)
+            new_entries = max(new_entries, len(scored))
+            strong_entries = max(strong_entries, sum(1 for entry in scored if entry.score >= STRONG_ENTRY_SCORE))
+            entries.extend(scored)
+        if health is not None:
+            health.record_success(url, elapsed, raw_entries, new_entries, strong_entries)
+        return entries
+
+    feeds = [accounts_for_feed[0][1] for accounts_for_feed in subscribers.values()]
+    return fetch_research_entries(feeds, workers, deadline, fetch=fetch, health=health)
+
+
 def create_bluesky_session(handle: str, app_password: str) -> dict | None:
     try:
-        response = requests.post(
-            "https://bsky.social/xrpc/com.atproto.server.createSession",
+        response = HTTP.post(
+            f"{BLUESKY_PDS_URL}/xrpc/com.atproto.server.createSession",
             json={"identifier": handle, "password": app_password},
-            timeout=REQUEST_TIMEOUT,
         )
         response.raise_for_status()
         return response.json()
@@ -574,35 +2800,514 @@ def create_bluesky_session(handle: str, app_password: str) -> dict | None:
         return None
 
 
-def post_to_bluesky(post_text: str, session: dict, reply: dict | None = None) -> dict | None:
+def refresh_bluesky_session(refresh_jwt: str) -> dict | None:
+    try:
+        response = HTTP.post(
+            f"{BLUESKY_PDS_URL}/xrpc/com.atproto.server.refreshSession",
+            headers={"Authorization": f"Bearer {refresh_jwt}"},
+        )
+        response.raise_for_status()
+        return response.json()
+    except requests.RequestException as exc:
+        print(f"Error refreshing session: {exc}")
+        return None
+
+
+def jwt_expiry(token: str) -> float | None:
+    """Read the ``exp`` claim from a JWT without verifying it."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class BlueskySession:
+    """Keeps access/refresh tokens on disk and refreshes them instead of logging in again.
+
+    The token file is written with owner-only permissions. ``createSession``
+    is only called when there is no stored session or refreshing it fails.
+    """
+
+    def __init__(
+        self,
+        handle: str,
+        app_password: str,
+        path: str = SESSION_FILE,
+        rate_limiter: "RateLimiter | None" = None,
+    ):
+        self.handle = handle
+        self.app_password = app_password
+        self.path = path
+        self.rate_limiter = rate_limiter or POST_RATE_LIMITER
+        self.data = None
+        self._lock = threading.Lock()
+
+    @property
+    def access_jwt(self) -> str:
+        return self.data["accessJwt"]
+
+    @property
+    def did(self) -> str:
+        return self.data["did"]
+
+    def ensure(self) -> bool:
+        """Make sure a usable access token is loaded, refreshing or logging in as needed."""
+        with self._lock:
+            if self.data is None:
+                self.data = self._load()
+                if self.data:
+                    print("Reusing stored Bluesky session")
+
+            if self.data and self._access_is_fresh():
+                return True
+            if self.data and self._refresh():
+                return True
+            return self._create()
+
+    def refresh(self) -> bool:
+        """Refresh after the server reported an expired token, logging in again if needed."""
+        with self._lock:
+            return self._refresh() or self._create()
+
+    def _access_is_fresh(self) -> bool:
+        expires_at = jwt_expiry(self.data.get("accessJwt", ""))
+        return expires_at is not None and expires_at - SESSION_REFRESH_MARGIN > CLOCK.time()
+
+    def _refresh(self) -> bool:
+        refresh_jwt = (self.data or {}).get("refreshJwt")
+        if not refresh_jwt:
+            return False
+        refreshed = refresh_bluesky_session(refresh_jwt)
+        if not refreshed:
+            return False
+        self.data = {**self.data, **refreshed}
+        self._save()
+        print("[ok] Refreshed Bluesky session")
+        return True
+
+    def _create(self) -> bool:
+        created = create_bluesky_session(self.handle, self.app_password)
+        if not created:
+            # Keep the old tokens: callers read did/access_jwt, and a rejected
+            # request is handled where a None session would raise TypeError.
+            return False
+        self.data = created
+        self._save()
+        return True
+
+    def _load(self) -> dict | None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (json.JSONDecodeError, OSError):
+            return None
+
+        if not isinstance(data, dict) or not data.get("accessJwt") or not data.get("did"):
+            return None
+        if data.get("handle", "").lower() != self.handle.lower() and data.get("did") != self.handle:
+            return None
+        return data
+
+    def _save(self) -> None:
+        stored = {key: self.data.get(key) for key in ("did", "handle", "accessJwt", "refreshJwt")}
+        stored["handle"] = stored.get("handle") or self.handle
+        tmp_path = f"{self.path}.tmp"
+        descriptor = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(descriptor, "w", encoding="utf-8") as file:
+            json.dump(stored, file)
+        os.chmod(tmp_path, 0o600)
+        os.replace(tmp_path, self.path)
+
+
+def parse_delay_range(value: str | None, default: tuple[float, float]) -> tuple[float, float]:
+    """Parse ``"6-10"`` (or ``"6"``) seconds into a (low, high) range."""
+    if not value:
+        return default
+    low, _, high = value.partition("-")
+    low_value = float(low)
+    high_value = float(high) if high else low_value
+    return min(low_value, high_value), max(low_value, high_value)
+
+
+class RateLimiter:
+    """Token bucket kept in step with the PDS ``RateLimit-*`` response headers.
+
+    Until the server reports a policy the bucket never blocks. After each
+    response the remaining count and reset time replace the local estimate;
+    between responses tokens refill at ``limit / window``.
+    """
+
+    def __init__(self):
+        self.capacity = None
+        self.tokens = None
+        self.refill_per_second = 0.0
+        self.reset_at = 0.0
+        self._updated_at = CLOCK.time()
+        self._lock = threading.Lock()
+
+    def observe(self, headers) -> None:
+        limit = headers.get("RateLimit-Limit")
+        remaining = headers.get("RateLimit-Remaining")
+        if limit is None or remaining is None:
+            return
+
+        try:
+            capacity = float(limit)
+            tokens = float(remaining)
+            reset_at = float(headers.get("RateLimit-Reset", 0) or 0)
+        except ValueError:
+            return
+
+        window = None
+        policy = headers.get("RateLimit-Policy", "")
+        for part in policy.split(";")[1:]:
+            key, _, value = part.strip().partition("=")
+            if key == "w" and value.isdigit():
+                window = float(value)
+
+        with self._lock:
+            now = CLOCK.time()
+            self.capacity = capacity
+            self.tokens = tokens
+            self.reset_at = reset_at
+            if window:
+                self.refill_per_second = capacity / window
+            elif reset_at > now:
+                self.refill_per_second = max(capacity - tokens, 1.0) / (reset_at - now)
+            self._updated_at = now
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+        with self._lock:
+            if self.tokens is None:
+                return 0.0
+
+            now = CLOCK.time()
+            if self.refill_per_second:
+                self.tokens = min(self.capacity, self.tokens + (now - self._updated_at) * self.refill_per_second)
+            if self.reset_at and now >= self.reset_at:
+                self.tokens = self.capacity
+                self.reset_at = 0.0
+            self._updated_at = now
+
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            if self.reset_at > now:
+                return self.reset_at - now
+            if self.refill_per_second:
+                return -self.tokens / self.refill_per_second
+            return 0.0
+
+
+POST_RATE_LIMITER = RateLimiter()
+
+
+class PostingScheduler:
+    """Paces posts with jittered gaps and waits out the server's rate limit.
+
+    Gaps are measured from the previous post, so time spent fetching and
+    formatting in the meantime counts toward them.
+    """
+
+    def __init__(
+        self,
+        reply_delay: tuple[float, float] = REPLY_DELAY_RANGE,
+        thread_delay: tuple[float, float] = THREAD_DELAY_RANGE,
+        limiter: RateLimiter | None = None,
+    ):
+        self.delays = {"reply": reply_delay, "thread": thread_delay}
+        self.limiter = limiter or POST_RATE_LIMITER
+        self._last_post = None
+
+    def next_delay(self, kind: str) -> float:
+        pacing = 0.0
+        if self._last_post is not None:
+            low, high = self.delays[kind]
+            pacing = random.uniform(low, high) - (CLOCK.monotonic() - self._last_post)
+        return max(pacing, self.limiter.reserve(), 0.0)
+
+    async def wait_turn(self, kind: str, interruptible: bool = False) -> bool:
+        """Sleep until the next post may go out. Returns False if shutdown was requested."""
+        delay = self.next_delay(kind)
+        if delay > 0:
+            if kind == "thread":
+                print(f"Waiting {delay:.0f}s before next research brief...")
+            if interruptible:
+                if await asyncio.to_thread(CLOCK.wait, SHUTDOWN, delay):
+                    return False
+            else:
+                await CLOCK.async_sleep(delay)
+        return True
+
+    def mark_posted(self) -> None:
+        self._last_post = CLOCK.monotonic()
+
+
+def is_expired_token_response(response: requests.Response) -> bool:
+    if response.status_code not in (400, 401):
+        return False
+    try:
+        return response.json().get("error") == "ExpiredToken"
+    except ValueError:
+        return False
+
+
+def xrpc_request(session: BlueskySession, method: str, nsid: str, **kwargs) -> requests.Response:
+    """Call an XRPC endpoint, refreshing the session once on ExpiredToken."""
+    for attempt in range(2):
+        response = HTTP.request(
+            method,
+            f"{BLUESKY_PDS_URL}/xrpc/{nsid}",
+            headers={"Authorization": f"Bearer {session.access_jwt}"},
+            **kwargs,
+        )
+        if method == "POST":
+            session.rate_limiter.observe(response.headers)
+        if attempt == 0 and is_expired_token_response(response):
+            print("Access token expired, refreshing session...")
+            if session.refresh():
+                continue
+        break
+    response.raise_for_status()
+    return response
+
+
+def xrpc_post(session: BlueskySession, nsid: str, body: dict) -> requests.Response:
+    return xrpc_request(session, "POST", nsid, json=body)
+
+
+def xrpc_get(session: BlueskySession, nsid: str, params: dict) -> requests.Response:
+    return xrpc_request(session, "GET", nsid, params=params)
+
+
+def make_post_record(post_text: str, reply: dict | None = None) -> dict:
     record = {
         "$type": "app.bsky.feed.post",
         "text": trim_to_limit(post_text),
-        "createdAt": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
+        "createdAt": CLOCK.now().isoformat().replace("+00:00", "Z"),
         "langs": ["en"],
     }
     if reply:
         record["reply"] = reply
+    return record
 
+
+@timed_stage("post_to_bluesky")
+def post_to_bluesky(post_text: str, session: BlueskySession, reply: dict | None = None) -> dict | None:
     try:
-        response = requests.post(
-            "https://bsky.social/xrpc/com.atproto.repo.createRecord",
-            headers={"Authorization": f"Bearer {session['accessJwt']}"},
-            json={
-                "repo": session["did"],
+        response = xrpc_post(
+            session,
+            "com.atproto.repo.createRecord",
+            {
+                "repo": session.did,
                 "collection": "app.bsky.feed.post",
-                "record": record,
+                "record": make_post_record(post_text, reply),
             },
-            timeout=REQUEST_TIMEOUT,
         )
-        response.raise_for_status()
+        METRICS.inc("posts_published")
         return response.json()
     except requests.RequestException as exc:
         print(f"Error posting to Bluesky: {exc}")
+        METRICS.inc("post_errors")
         return None
 
 
-def post_thread_to_bluesky(thread: list[str], session: dict, dry_run: bool = False) -> int:
+def dag_cbor_encode(value) -> bytes:
+    """Encode JSON-like data as DAG-CBOR (deterministic CBOR, no floats)."""
+
+    def head(major: int, length: int) -> bytes:
+        if length < 24:
+            return bytes([major << 5 | length])
+        for size, info in ((1, 24), (2, 25), (4, 26), (8, 27)):
+            if length < 1 << (8 * size):
+                return bytes([major << 5 | info]) + length.to_bytes(size, "big")
+        raise ValueError("integer too large for CBOR")
+
+    if value is None:
+        return b"\xf6"
+    if value is True:
+        return b"\xf5"
+    if value is False:
+        return b"\xf4"
+    if isinstance(value, int):
+        return head(0, value) if value >= 0 else head(1, -1 - value)
+    if isinstance(value, bytes):
+        return head(2, len(value)) + value
+    if isinstance(value, str):
+        encoded = value.encode("utf-8")
+        return head(3, len(encoded)) + encoded
+    if isinstance(value, (list, tuple)):
+        return head(4, len(value)) + b"".join(dag_cbor_encode(item) for item in value)
+    if isinstance(value, dict):
+        items = sorted(((key.encode("utf-8"), item) for key, item in value.items()), key=lambda pair: (len(pair[0]), pair[0]))
+        body = b"".join(head(3, len(key)) + key + dag_cbor_encode(item) for key, item in items)
+        return head(5, len(value)) + body
+    raise TypeError(f"cannot DAG-CBOR encode {type(value).__name__}")
+
+
+def compute_cid(record: dict) -> str:
+    """CIDv1 (dag-cbor, sha2-256) of a record, as base32 multibase text."""
+    digest = hashlib.sha256(dag_cbor_encode(record)).digest()
+    raw = bytes([0x01, 0x71, 0x12, 0x20]) + digest
+    return "b" + base64.b32encode(raw).decode("ascii").lower().rstrip("=")
+
+
+_last_tid_micros = 0
+_tid_lock = threading.Lock()
+_tid_clock_id = random.randrange(1024)
+
+
+def next_tid() -> str:
+    """A new record key in the atproto TID format: microseconds and clock ID in sortable base32."""
+    global _last_tid_micros
+    with _tid_lock:
+        micros = max(int(CLOCK.time() * 1_000_000), _last_tid_micros + 1)
+        _last_tid_micros = micros
+    value = (micros << 10) | _tid_clock_id
+    chars = []
+    for _ in range(13):
+        chars.append(TID_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+# RFC 8949 Appendix A encodings, a DAG-CBOR key order case (shorter keys first),
+# and the well-known CID of an empty DAG-CBOR map.
+DAG_CBOR_VECTORS = (
+    (0, "00"),
+    (23, "17"),
+    (24, "1818"),
+    (1000, "1903e8"),
+    (1000000, "1a000f4240"),
+    (-1, "20"),
+    (-1000, "3903e7"),
+    ("", "60"),
+    ("IETF", "6449455446"),
+    ("\u00fc", "62c3bc"),
+    ([1, [2, 3], [4, 5]], "8301820203820405"),
+    ({"a": 1, "b": [2, 3]}, "a26161016162820203"),
+    ({"bb": 1, "a": 2, "c": 3}, "a361610261630362626201"),
+    (b"\x01\x02\x03\x04", "4401020304"),
+    (None, "f6"),
+)
+CID_VECTORS = (({}, "bafyreigbtj4x7ip5legnfznufuopl4sg4knzc2cof6duas4b3q2fy6swua"),)
+
+
+@functools.lru_cache(maxsize=1)
+def verify_cid_vectors() -> bool:
+    """Check the encoder against known vectors before trusting locally computed CIDs."""
+    for value, expected in DAG_CBOR_VECTORS:
+        if dag_cbor_encode(value).hex() != expected:
+            return False
+    return all(compute_cid(value) == expected for value, expected in CID_VECTORS)
+
+
+def build_thread_writes(thread: list[str], did: str) -> tuple[list[dict], list[dict]]:
+    """Build applyWrites creates for a whole thread, linking replies by local CIDs."""
+    writes = []
+    refs = []
+    root_ref = None
+    parent_ref = None
+    for post_text in thread:
+        reply = {"root": root_ref, "parent": parent_ref} if root_ref else None
+        record = make_post_record(post_text, reply)
+        rkey = next_tid()
+        ref = {"uri": f"at://{did}/app.bsky.feed.post/{rkey}", "cid": compute_cid(record)}
+        writes.append(
+            {
+                "$type": "com.atproto.repo.applyWrites#create",
+                "collection": "app.bsky.feed.post",
+                "rkey": rkey,
+                "value": record,
+            }
+        )
+        refs.append(ref)
+        root_ref = root_ref or ref
+        parent_ref = ref
+    return writes, refs
+
+
+# Set once the server disagrees with a locally computed CID; later threads
+# in this process are then posted one record at a time.
+ATOMIC_CID_MISMATCH = threading.Event()
+
+
+def delete_thread_writes(session: BlueskySession, writes: list[dict]) -> bool:
+    """Remove the records created by ``writes`` in one applyWrites call."""
+    deletes = [
+        {"$type": "com.atproto.repo.applyWrites#delete", "collection": write["collection"], "rkey": write["rkey"]}
+        for write in writes
+    ]
+    try:
+        xrpc_post(session, "com.atproto.repo.applyWrites", {"repo": session.did, "writes": deletes})
+    except requests.RequestException as exc:
+        print(f"Error deleting thread records: {exc}")
+        return False
+    return True
+
+
+@timed_stage("post_thread_atomically")
+def post_thread_atomically(thread: list[str], session: BlueskySession) -> list[str]:
+    """Publish every post of a thread in one applyWrites call: all or nothing.
+
+    Returns the URIs of the new posts, or an empty list if nothing was
+    written. If the server's CIDs differ from ours, the replies point at
+    records that do not exist, so the thread is deleted again, an empty list
+    is returned and atomic posting is switched off via ``ATOMIC_CID_MISMATCH``.
+    """
+    writes, refs = build_thread_writes(thread, session.did)
+    try:
+        response = xrpc_post(
+            session,
+            "com.atproto.repo.applyWrites",
+            {"repo": session.did, "validate": True, "writes": writes},
+        )
+    except requests.RequestException as exc:
+        print(f"Error publishing thread to Bluesky: {exc}")
+        return []
+
+    try:
+        results = response.json().get("results", [])
+    except ValueError:
+        results = []
+    mismatched = [ref["uri"] for ref, result in zip(refs, results) if result.get("cid") not in (None, ref["cid"])]
+    if mismatched:
+        ATOMIC_CID_MISMATCH.set()
+        print(f"[warn] Server CIDs differ from local CIDs for: {', '.join(mismatched)}")
+        if delete_thread_writes(session, writes):
+            print("[warn] Deleted the thread; later threads are posted one record at a time")
+        else:
+            print(f"[warn] Could not delete the thread, remove these records by hand: {', '.join(ref['uri'] for ref in refs)}")
+        return []
+    METRICS.inc("posts_published", len(thread))
+    return [ref["uri"] for ref in refs]
+
+
+async def post_thread_async(
+    thread: list[str],
+    session: BlueskySession | None,
+    scheduler: PostingScheduler,
+    dry_run: bool = False,
+    atomic: bool = False,
+    published_uris: list[str] | None = None,
+) -> int:
+    """Post a thread and return how many posts went out; their URIs are appended to ``published_uris``."""
+    published_uris = [] if published_uris is None else published_uris
+    if atomic and not dry_run and not ATOMIC_CID_MISMATCH.is_set():
+        if verify_cid_vectors():
+            for index, post_text in enumerate(thread, 1):
+                print(f"\nThread post {index}/{len(thread)} ({len(post_text)} chars)")
+                print(post_text)
+            uris = await asyncio.to_thread(post_thread_atomically, thread, session)
+            scheduler.mark_posted()
+            published_uris.extend(uris)
+            return len(uris)
+        print("[warn] DAG-CBOR self-check failed, posting the thread one record at a time")
+
     root_ref = None
     parent_ref = None
     published = 0
@@ -615,34 +3320,82 @@ def post_thread_to_bluesky(thread: list[str], session: dict, dry_run: bool = Fal
             published += 1
             continue
 
+        if index > 1:
+            await scheduler.wait_turn("reply")
+
         reply_ref = None
         if root_ref and parent_ref:
             reply_ref = {"root": root_ref, "parent": parent_ref}
 
-        result = post_to_bluesky(post_text, session, reply_ref)
+        result = await asyncio.to_thread(post_to_bluesky, post_text, session, reply_ref)
+        scheduler.mark_posted()
         if not result:
             break
 
         current_ref = {"uri": result["uri"], "cid": result["cid"]}
+        published_uris.append(result["uri"])
         if root_ref is None:
             root_ref = current_ref
         parent_ref = current_ref
         published += 1
 
-        if index < len(thread):
-            time.sleep(random.randint(6, 10))
-
     return published
 
 
-def select_entries(entries: Iterable[ResearchEntry], posted_items: set[str], limit: int) -> list[ResearchEntry]:
-    new_entries = [entry for entry in entries if entry.item_id not in posted_items]
-    strong_entries = [entry for entry in new_entries if entry.score >= 10]
+@timed_stage("harvest_engagement")
+def harvest_engagement(store: EngagementStore, session: BlueskySession, now: float | None = None) -> int:
+    """Refresh counts for posts that may still be gaining engagement, 25 URIs per getPosts call."""
+    uris = store.due_posts(now)
+    calls = 0
+    for start in range(0, len(uris), ENGAGEMENT_BATCH_SIZE):
+        batch = uris[start : start + ENGAGEMENT_BATCH_SIZE]
+        try:
+            response = xrpc_get(session, "app.bsky.feed.getPosts", {"uris": batch})
+            posts = {post["uri"]: post for post in response.json().get("posts", []) if "uri" in post}
+        except (requests.RequestException, ValueError) as exc:
+            print(f"Error fetching engagement: {exc}")
+            uris = uris[:start]
+            break
+        store.update_counts(batch, posts, now)
+        calls += 1
+
+    METRICS.inc("engagement_calls", calls)
+    METRICS.inc("engagement_posts_checked", len(uris))
+    if uris:
+        print(f"Engagement: refreshed {len(uris)} posts in {calls} getPosts calls")
+    return len(uris)
+
+
+def select_entries(entries: Iterable[ResearchEntry], posted_items: Container[str], limit: int) -> list[ResearchEntry]:
+    find_similar = getattr(posted_items, "find_similar", None)
+    new_entries = []
+    for entry in entries:
+        if entry.item_id in posted_items:
+            continue
+        if find_similar and find_similar(entry.fingerprint):
+            print(f"Skipping near-duplicate of a posted story: {entry.title}")
+            METRICS.inc("near_duplicates_skipped", against="posted")
+            continue
+        new_entries.append(entry)
+
+    strong_entries = [entry for entry in new_entries if entry.score >= STRONG_ENTRY_SCORE]
     pool = strong_entries or new_entries
-    return list(pool[:limit])
+
+    # Two sources can carry the same story in one run, so keep picks distinct too.
+    picked = MinHashIndex()
+    selected = []
+    for entry in pool:
+        if picked.find(entry.fingerprint):
+            METRICS.inc("near_duplicates_skipped", against="selected")
+            continue
+        picked.add(entry.item_id, entry.fingerprint)
+        selected.append(entry)
+        if len(selected) == limit:
+            break
+    return selected
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Post creator growth research threads to Bluesky.")
     parser.add_argument(
         "--dry-run",
@@ -655,72 +3408,499 @@ def parse_args() -> argparse.Namespace:
         default=int(os.environ.get("THREADS_PER_RUN", DEFAULT_THREADS_PER_RUN)),
         help="Number of research threads to publish.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--fetch-workers",
+        type=int,
+        default=int(os.environ.get("FETCH_WORKERS", FETCH_WORKERS)),
+        help="Feeds fetched in parallel. Use 1 to fetch one feed at a time.",
+    )
+    parser.add_argument(
+        "--fetch-deadline",
+        type=float,
+        default=float(os.environ.get("FETCH_DEADLINE", FETCH_DEADLINE)),
+        help="Seconds to wait for all feeds before moving on without the slow ones.",
+    )
+    parser.add_argument(
+        "--build-workers",
+        type=int,
+        default=int(os.environ.get("BUILD_WORKERS", BUILD_WORKERS)),
+        help="Threads built in parallel while article pages are fetched.",
+    )
+    parser.add_argument(
+        "--no-article-cache",
+        action="store_true",
+        help="Fetch article pages even when a fresh extracted copy is cached.",
+    )
+    parser.add_argument(
+        "--fixtures",
+        metavar="DIR",
+        help="Serve feeds and articles from recorded fixtures (see benchmark.py). Implies --dry-run.",
+    )
+    parser.add_argument(
+        "--atomic-threads",
+        action="store_true",
+        default=os.environ.get("ATOMIC_THREADS", "").lower() in {"1", "true", "yes"},
+        help="Publish each thread in a single applyWrites call so it is never left half-posted.",
+    )
+    parser.add_argument(
+        "--reply-delay",
+        default=os.environ.get("REPLY_DELAY"),
+        metavar="SECONDS",
+        help="Gap between posts in a thread, e.g. 6-10 (default).",
+    )
+    parser.add_argument(
+        "--thread-delay",
+        default=os.environ.get("THREAD_DELAY"),
+        metavar="SECONDS",
+        help="Gap between threads, e.g. 25-45 (default).",
+    )
+    parser.add_argument(
+        "--metrics",
+        metavar="DIR",
+        default=os.environ.get("METRICS_DIR"),
+        help="Collect per-stage metrics and write run_metrics.jsonl and bot.prom into DIR.",
+    )
+    parser.add_argument(
+        "--engagement-weights",
+        action="store_true",
+        default=os.environ.get("ENGAGEMENT_WEIGHTS", "").lower() in {"1", "true", "yes"},
+        help="Adjust scores by how earlier threads from each source and keyword performed.",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="DIR",
+        help="Profile each stage with cProfile and tracemalloc and write reports into DIR.",
+    )
+    parser.add_argument(
+        "--poll-all-feeds",
+        action="store_true",
+        default=os.environ.get("POLL_ALL_FEEDS", "").lower() in {"1", "true", "yes"},
+        help="Poll every feed this run, even ones the adaptive schedule would skip.",
+    )
+    parser.add_argument(
+        "--accounts",
+        metavar="PATH",
+        default=os.environ.get("BOT_ACCOUNTS_FILE"),
+        help="Run every account in this JSON file in one process, fetching shared feeds once.",
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running: poll feeds and post on a schedule until stopped.",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=float(os.environ.get("POLL_INTERVAL_MINUTES", DAEMON_POLL_MINUTES)),
+        help="Daemon mode: minutes between feed polls.",
+    )
+    parser.add_argument(
+        "--post-interval",
+        type=float,
+        default=float(os.environ.get("POST_INTERVAL_MINUTES", DAEMON_POST_MINUTES)),
+        help="Daemon mode: minimum minutes between posting rounds.",
+    )
+    parser.add_argument(
+        "--preview",
+        type=int,
+        metavar="N",
+        help=f"Dry run that formats threads for the top N new entries (max {MAX_PREVIEW_ENTRIES}).",
+    )
+    return parser.parse_args(argv)
 
 
-def main() -> None:
-    args = parse_args()
-    limit = max(1, min(args.limit, 5))
-    dry_run = args.dry_run or os.environ.get("DRY_RUN", "").lower() in {"1", "true", "yes"}
+SHUTDOWN = threading.Event()
+RUN_ID = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
-    print("\n" + "=" * 60)
-    print(f"Creator Growth Research Bot - {datetime.now().isoformat(timespec='seconds')}")
-    print("=" * 60 + "\n")
 
-    session = None
-    if not dry_run:
-        handle = os.environ.get("BLUESKY_HANDLE")
-        app_password = os.environ.get("BLUESKY_APP_PASSWORD")
+def export_metrics(directory: str | None) -> None:
+    """Append this run's metrics to run_metrics.jsonl and rewrite bot.prom."""
+    if not directory or not METRICS.enabled:
+        return
+    os.makedirs(directory, exist_ok=True)
+    METRICS.write_jsonl(os.path.join(directory, "run_metrics.jsonl"), RUN_ID)
+    METRICS.write_prometheus(os.path.join(directory, "bot.prom"))
+    print(f"Metrics written to {directory}")
 
-        if not handle or not app_password:
-            print("ERROR: Missing BLUESKY_HANDLE or BLUESKY_APP_PASSWORD.")
-            return
 
-        print("Authenticating with Bluesky...")
-        session = create_bluesky_session(handle, app_password)
-        if not session:
-            print("Failed to authenticate. Exiting.")
-            return
-        print("[ok] Authentication successful")
-    else:
-        print("[dry-run] Fetching and formatting only. Nothing will be posted.")
+def request_shutdown(signum, frame) -> None:
+    print(f"\nReceived signal {signum}, finishing the current step and shutting down...")
+    SHUTDOWN.set()
+
 
-    entries = fetch_research_entries()
-    print(f"\nFound {len(entries)} total research entries")
+def authenticate_from_env(
+    account: AccountProfile | None = None,
+    rate_limiter: RateLimiter | None = None,
+) -> BlueskySession | None:
+    account = account or DEFAULT_ACCOUNT
+    handle = os.environ.get(account.handle_env)
+    app_password = os.environ.get(account.password_env)
+
+    if not handle or not app_password:
+        print(f"ERROR: Missing {account.handle_env} or {account.password_env}.")
+        return None
+
+    print("Authenticating with Bluesky...")
+    session = BlueskySession(handle, app_password, account.path(SESSION_FILE), rate_limiter)
+    if not session.ensure():
+        print("Failed to authenticate. Exiting.")
+        return None
+    print("[ok] Authentication successful")
+    return session
+
+
+def scheduler_from_args(args: argparse.Namespace, limiter: RateLimiter | None = None) -> PostingScheduler:
+    return PostingScheduler(
+        reply_delay=parse_delay_range(args.reply_delay, REPLY_DELAY_RANGE),
+        thread_delay=parse_delay_range(args.thread_delay, THREAD_DELAY_RANGE),
+        limiter=limiter,
+    )
+
+
+def publish_entries(
+    to_post: list[ResearchEntry],
+    session: BlueskySession | None,
+    posted_items: PostedStore,
+    dry_run: bool,
+    args: argparse.Namespace,
+    scheduler: PostingScheduler | None = None,
+    threads: list[list[str]] | None = None,
+    account: AccountProfile | None = None,
+) -> None:
+    scheduler = scheduler or scheduler_from_args(args)
+    asyncio.run(publish_entries_async(to_post, session, posted_items, dry_run, args, scheduler, threads, account))
+    ARTICLE_CACHE.evict()
+
+
+async def publish_entries_async(
+    to_post: list[ResearchEntry],
+    session: BlueskySession | None,
+    posted_items: PostedStore,
+    dry_run: bool,
+    args: argparse.Namespace,
+    scheduler: PostingScheduler,
+    threads: list[list[str]] | None = None,
+    account: AccountProfile | None = None,
+) -> None:
+    """Build threads in the background and post each one as soon as it is ready and allowed.
+
+    ``threads`` skips the build step with threads that were already built in order.
+    """
+    account = account or DEFAULT_ACCOUNT
+    use_cache = not args.no_article_cache
+    build_slots = asyncio.Semaphore(max(1, args.build_workers))
+
+    async def build(entry: ResearchEntry) -> list[str]:
+        async with build_slots:
+            return await asyncio.to_thread(build_thread, entry, use_cache, account)
+
+    builds = []
+    if threads is None:
+        print(f"Building {len(to_post)} threads...")
+        builds = [asyncio.create_task(build(entry)) for entry in to_post]
+    try:
+        for index, entry in enumerate(to_post, 1):
+            if index > 1 and not dry_run:
+                if not await scheduler.wait_turn("thread", interruptible=True):
+                    break
+
+            thread = threads[index - 1] if threads is not None else await builds[index - 1]
+            print("-" * 60)
+            print(f"Research brief {index}/{len(to_post)}")
+            if account is not DEFAULT_ACCOUNT:
+                print(f"Account: {account.name}")
+            print(f"Title : {entry.title}")
+            print(f"Source: {entry.source}")
+            print(f"Score : {entry.score}")
+
+            uris = []
+            published_count = await post_thread_async(
+                thread, session, scheduler, dry_run=dry_run, atomic=args.atomic_threads, published_uris=uris
+            )
+
+            if published_count:
+                print(f"[ok] Published/formatted {published_count}/{len(thread)} posts")
+                METRICS.inc("threads_published" if not dry_run else "threads_formatted")
+                if not dry_run:
+                    posted_items.add(entry.item_id, entry.fingerprint)
+                    account.engagement.record_thread(entry, uris)
+            else:
+                print("[warn] No posts were published for this entry")
+    finally:
+        for build_task in builds:
+            build_task.cancel()
+
+
+def refresh_engagement(
+    args: argparse.Namespace,
+    session: BlueskySession | None,
+    account: AccountProfile | None = None,
+) -> None:
+    """Harvest counts for recent posts, then reload score bonuses if they are enabled."""
+    account = account or DEFAULT_ACCOUNT
+    if session and account.engagement.exists():
+        harvest_engagement(account.engagement, session)
+    if args.engagement_weights:
+        account.weights.load(account.engagement)
+
+
+def load_backlog(args: argparse.Namespace, account: AccountProfile | None = None) -> CandidateBacklog:
+    account = account or DEFAULT_ACCOUNT
+    # Fixture runs must not mix recorded entries into the real backlog, and
+    # recordings older than a week must still yield candidates.
+    if args.fixtures:
+        return CandidateBacklog(path=None, max_age_days=None)
+    return CandidateBacklog(path=account.path(BACKLOG_FILE), bodies=account.bodies)
+
+
+def load_feed_health(args: argparse.Namespace) -> FeedHealthStore:
+    # Like the backlog, fixture runs keep feed health in memory.
+    return FeedHealthStore(path=None if args.fixtures else FEED_HEALTH_FILE, adaptive=not args.poll_all_feeds)
+
+
+def run_once(
+    args: argparse.Namespace,
+    session: BlueskySession | None,
+    limit: int,
+    dry_run: bool,
+    profiler: StageProfiler | None = None,
+) -> None:
+    refresh_engagement(args, session)
+    backlog = load_backlog(args)
+    health = load_feed_health(args)
+    # Profiled runs fetch inline so cProfile sees the parsing work.
+    workers = 1 if profiler else args.fetch_workers
+    with profile_stage(profiler, "fetch"):
+        fetch_research_entries(workers=workers, deadline=args.fetch_deadline, backlog=backlog, health=health)
+    HTTP_CACHE.save()
+    # Dry runs leave the poll schedule alone, as they do the backlog.
+    if not dry_run:
+        health.save()
+
+    with profile_stage(profiler, "rank"):
+        posted_items = load_posted_store()
+        entries = backlog.ranked(posted_items)
+        print(f"{len(entries)} candidates in the backlog")
+        to_post = select_entries(entries, posted_items, limit) if entries else []
 
     if not entries:
         print("No entries found. Exiting.")
+        # Keep this run's seen marks, so quiet feeds stay cheap next time.
+        if not dry_run:
+            backlog.save()
         return
 
-    posted_items = set(load_posted_items())
-    to_post = select_entries(entries, posted_items, limit)
     print(f"Selected {len(to_post)} new high-signal entries\n")
 
-    if not to_post:
-        print("No new entries to post. Exiting.")
+    if to_post:
+        threads = None
+        # Previews have no pacing to overlap with, so build everything first and
+        # rank sentences across all articles at once.
+        if profiler or dry_run:
+            with profile_stage(profiler, "build"):
+                print(f"Building {len(to_post)} threads...")
+                workers = 1 if profiler else args.build_workers
+                threads = build_threads(to_post, workers, not args.no_article_cache)
+        with profile_stage(profiler, "post"):
+            publish_entries(to_post, session, posted_items, dry_run, args, threads=threads)
+    else:
+        print("No new entries to post.")
+
+    # Dry runs read the backlog but never write it, so previews don't use up candidates.
+    if not dry_run:
+        backlog.discard(entry.item_id for entry in to_post if entry.item_id in posted_items)
+        backlog.save()
+
+
+def run_accounts(args: argparse.Namespace, accounts: list[AccountProfile], limit: int, dry_run: bool) -> None:
+    """Run once for several accounts: feeds are fetched once, ranking and posting happen per account.
+
+    Each account posts through its own session, rate limiter and scheduler, so
+    one account waiting on its pacing never holds up another.
+    """
+    sessions = {}
+    limiters = {}
+    active = []
+    for account in accounts:
+        if account.state_dir:
+            os.makedirs(account.state_dir, exist_ok=True)
+        limiters[account.name] = RateLimiter()
+        if not dry_run:
+            print(f"[{account.name}] ", end="")
+            session = authenticate_from_env(account, limiters[account.name])
+            if not session:
+                print(f"[{account.name}] Skipping this account")
+                continue
+            sessions[account.name] = session
+        refresh_engagement(args, sessions.get(account.name), account)
+        active.append(account)
+    if not active:
         return
 
-    for index, entry in enumerate(to_post, 1):
-        print("-" * 60)
-        print(f"Research brief {index}/{len(to_post)}")
-        print(f"Title : {entry.title}")
-        print(f"Source: {entry.source}")
-        print(f"Score : {entry.score}")
+    backlogs = {account.name: load_backlog(args, account) for account in active}
+    health = load_feed_health(args)
+    fetch_for_accounts(active, backlogs, args.fetch_workers, args.fetch_deadline, health)
+    HTTP_CACHE.save()
+    if not dry_run:
+        health.save()
+
+    plans = []
+    for account in active:
+        posted_items = load_posted_store(account)
+        entries = backlogs[account.name].ranked(posted_items)
+        account_limit = limit if args.preview else max(1, min(account.threads_per_run, 5))
+        to_post = select_entries(entries, posted_items, account_limit) if entries else []
+        print(f"[{account.name}] {len(entries)} candidates, selected {len(to_post)}")
+        threads = None
+        if to_post and dry_run:
+            print(f"[{account.name}] Building {len(to_post)} threads...")
+            threads = build_threads(to_post, args.build_workers, not args.no_article_cache, account)
+        plans.append((account, to_post, posted_items, threads))
+
+    async def publish_all() -> None:
+        await asyncio.gather(
+            *(
+                publish_entries_async(
+                    to_post,
+                    sessions.get(account.name),
+                    posted_items,
+                    dry_run,
+                    args,
+                    scheduler_from_args(args, limiters[account.name]),
+                    threads,
+                    account,
+                )
+                for account, to_post, posted_items, threads in plans
+                if to_post
+            )
+        )
+
+    asyncio.run(publish_all())
+    ARTICLE_CACHE.evict()
+
+    if not dry_run:
+        for account, to_post, posted_items, _ in plans:
+            backlog = backlogs[account.name]
+            backlog.discard(entry.item_id for entry in to_post if entry.item_id in posted_items)
+            backlog.save()
+
+
+def run_daemon(args: argparse.Namespace, session: BlueskySession | None, limit: int, dry_run: bool) -> None:
+    """Poll feeds on an interval and post on a separate cadence until SIGTERM/SIGINT.
+
+    The HTTP pool, validator cache, posted history, candidate backlog and
+    feed health stay in memory between cycles, so each poll only fetches the
+    feeds that are due.
+    """
+    signal.signal(signal.SIGTERM, request_shutdown)
+    signal.signal(signal.SIGINT, request_shutdown)
+
+    poll_seconds = max(1.0, args.poll_interval * 60)
+    post_seconds = max(0.0, args.post_interval * 60)
+    posted_items = load_posted_store()
+    scheduler = scheduler_from_args(args)
+    backlog = load_backlog(args)
+    health = load_feed_health(args)
+    next_post_at = CLOCK.monotonic()
+    print(f"[daemon] Polling every {args.poll_interval:g} min, posting every {args.post_interval:g} min")
 
-        thread = build_thread(entry)
-        published_count = post_thread_to_bluesky(thread, session, dry_run=dry_run)
+    try:
+        while not SHUTDOWN.is_set():
+            print(f"\n[daemon] Poll at {datetime.now().isoformat(timespec='seconds')}")
+            refresh_engagement(args, session)
+            fetch_research_entries(
+                workers=args.fetch_workers, deadline=args.fetch_deadline, backlog=backlog, health=health
+            )
+            HTTP_CACHE.save()
+
+            ranked = backlog.ranked(posted_items)
+            print(f"[daemon] {len(ranked)} candidates waiting")
+
+            if CLOCK.monotonic() >= next_post_at and not SHUTDOWN.is_set():
+                to_post = select_entries(ranked, posted_items, limit)
+                if to_post and session and not session.ensure():
+                    print("[daemon] Could not refresh the Bluesky session, skipping this round")
+                    to_post = []
+                if to_post:
+                    publish_entries(to_post, session, posted_items, dry_run, args, scheduler)
+                    # Dry runs never record posts, so drop previewed entries here instead.
+                    backlog.discard(
+                        entry.item_id for entry in to_post if dry_run or entry.item_id in posted_items
+                    )
+                    next_post_at = CLOCK.monotonic() + post_seconds
 
-        if published_count:
-            print(f"[ok] Published/formatted {published_count}/{len(thread)} posts")
             if not dry_run:
-                save_posted_item(entry.item_id)
-        else:
-            print("[warn] No posts were published for this entry")
+                backlog.save()
+                health.save()
+            if args.metrics:
+                METRICS.write_prometheus(os.path.join(args.metrics, "bot.prom"))
+            CLOCK.wait(SHUTDOWN, poll_seconds)
+    finally:
+        HTTP_CACHE.save()
+        if not dry_run:
+            backlog.save()
+            health.save()
+        ARTICLE_CACHE.evict()
+        print("[daemon] State flushed")
+
+
+def main() -> None:
+    args = parse_args()
+    limit = max(1, min(args.limit, 5))
+    dry_run = args.dry_run or os.environ.get("DRY_RUN", "").lower() in {"1", "true", "yes"}
+    if args.preview:
+        limit = max(1, min(args.preview, MAX_PREVIEW_ENTRIES))
+        dry_run = True
+    if args.fixtures:
+        HTTP.use_fixtures(args.fixtures)
+        use_memory_caches()
+        dry_run = True
+    if args.metrics:
+        METRICS.enabled = True
+        os.makedirs(args.metrics, exist_ok=True)
+
+    print("\n" + "=" * 60)
+    print(f"Creator Growth Research Bot - {datetime.now().isoformat(timespec='seconds')}")
+    print("=" * 60 + "\n")
+
+    accounts = None
+    if args.accounts:
+        try:
+            accounts = load_accounts(args.accounts)
+        except (OSError, ValueError, TypeError) as exc:
+            print(f"ERROR: Could not read accounts file {args.accounts}: {exc}")
+            return
+        if args.daemon or args.profile:
+            print("[accounts] --accounts runs a single cycle, ignoring --daemon and --profile")
+            args.daemon = False
+            args.profile = None
+
+    session = None
+    if dry_run:
+        print("[dry-run] Fetching and formatting only. Nothing will be posted.")
+    elif accounts is None:
+        session = authenticate_from_env()
+        if not session:
+            return
+
+    profiler = None
+    if args.profile and args.daemon:
+        print("[profile] --profile only covers single runs, ignoring it in daemon mode")
+    elif args.profile:
+        profiler = StageProfiler(args.profile)
+
+    if accounts is not None:
+        run_accounts(args, accounts, limit, dry_run)
+    elif args.daemon:
+        run_daemon(args, session, limit, dry_run)
+    else:
+        run_once(args, session, limit, dry_run, profiler)
 
-        if not dry_run and index < len(to_post):
-            wait_time = random.randint(25, 45)
-            print(f"Waiting {wait_time}s before next research brief...")
-            time.sleep(wait_time)
+    HTTP_CACHE.save()
+    HTTP.print_stats()
+    export_metrics(args.metrics)
+    if profiler:
+        profiler.print_summary()
 
     print("\n" + "=" * 60)
     print(f"Bot finished at {datetime.now().isoformat(timespec='seconds')}")
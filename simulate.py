@@ -0,0 +1,624 @@
+#!/usr/bin/env python3
+"""
+Offline simulation of scheduled bot runs on a virtual clock.
+
+Replays a timeline of recorded feed snapshots through the real fetch,
+select_entries(), build_thread() and posting code. Posts go to an in-process
+fake PDS and every pacing wait only moves the virtual clock forward, so weeks
+of 6-hour runs finish in seconds. The report lists what would have been
+posted, duplicates among the posted stories, and posting times.
+
+    python simulate.py generate sim/ --days 14
+    python simulate.py run sim/timeline.json --output sim-report.json
+    python simulate.py run sim/timeline.json -- --limit 1 --engagement-weights
+"""
+
+import argparse
+import asyncio
+import base64
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+import benchmark
+import bot
+
+
+SIM_START = "2026-06-01T00:00:00+00:00"
+SIM_HANDLE = "sim.bsky.social"
+ACCESS_TOKEN_SECONDS = 2 * 60 * 60
+REFRESH_TOKEN_SECONDS = 60 * 24 * 60 * 60
+FEED_WINDOW = 20
+SYLLABLES = ("ka", "lo", "mi", "ter", "san", "vo", "ri", "den", "pa", "lu", "mor", "shi", "ba", "nel", "to", "gra")
+
+
+class VirtualClock(bot.Clock):
+    """Clock that only moves when something sleeps on it or the simulation advances it."""
+
+    def __init__(self, start: float):
+        self._now = start
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        return self._now
+
+    def monotonic(self) -> float:
+        return self._now
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self._now, timezone.utc)
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self._now += max(0.0, seconds)
+
+    def wait(self, event: threading.Event, seconds: float) -> bool:
+        if event.is_set():
+            return True
+        self.sleep(seconds)
+        return event.is_set()
+
+    async def async_sleep(self, seconds: float) -> None:
+        self.sleep(seconds)
+        await asyncio.sleep(0)
+
+    def advance_to(self, timestamp: float) -> None:
+        with self._lock:
+            self._now = max(self._now, timestamp)
+
+
+def fake_jwt(subject: str, expires_at: float) -> str:
+    def encode(value: dict) -> str:
+        return base64.urlsafe_b64encode(json.dumps(value).encode("utf-8")).decode("ascii").rstrip("=")
+
+    return f"{encode({'alg': 'none'})}.{encode({'sub': subject, 'exp': int(expires_at)})}.sim"
+
+
+class FakePds(BaseAdapter):
+    """In-process stand-in for the XRPC endpoints the bot calls.
+
+    Access tokens expire after two hours of virtual time, so long simulations
+    go through the same refresh path as real runs. Like counts grow with a
+    post's age by a fixed per-post amount, which keeps engagement-weighted
+    runs reproducible.
+    """
+
+    def __init__(self, clock: VirtualClock):
+        super().__init__()
+        self.clock = clock
+        self.did = "did:plc:simulation"
+        self.posts = {}
+        self.roots = []
+        self.calls = {}
+        self._sequence = 0
+        self._lock = threading.Lock()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        parts = urlsplit(request.url)
+        nsid = parts.path.rsplit("/", 1)[-1]
+        body = json.loads(request.body) if request.body else {}
+        with self._lock:
+            self.calls[nsid] = self.calls.get(nsid, 0) + 1
+            status, payload = self._handle(nsid, request.headers.get("Authorization", ""), body, parse_qs(parts.query))
+
+        response = requests.Response()
+        response.url = request.url
+        response.request = request
+        response.status_code = status
+        response.reason = "OK" if status == 200 else "Error"
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response.raw = io.BytesIO(json.dumps(payload).encode("utf-8"))
+        response.encoding = "utf-8"
+        return response
+
+    def close(self):
+        pass
+
+    def _handle(self, nsid: str, authorization: str, body: dict, query: dict) -> tuple[int, dict]:
+        if nsid == "com.atproto.server.createSession":
+            return 200, self._tokens()
+        if nsid == "com.atproto.server.refreshSession":
+            if not self._token_is_valid(authorization):
+                return 400, {"error": "ExpiredToken", "message": "Refresh token has expired"}
+            return 200, self._tokens()
+        if not self._token_is_valid(authorization):
+            return 400, {"error": "ExpiredToken", "message": "Token has expired"}
+
+        if nsid == "com.atproto.repo.createRecord":
+            uri = self._store(self._next_rkey(), body["record"])
+            return 200, {"uri": uri, "cid": bot.compute_cid(body["record"])}
+        if nsid == "com.atproto.repo.applyWrites":
+            results = []
+            for write in body.get("writes", []):
+                if write["$type"].endswith("#delete"):
+                    self._delete(write["rkey"])
+                    results.append({"$type": "com.atproto.repo.applyWrites#deleteResult"})
+                    continue
+                uri = self._store(write["rkey"], write["value"])
+                results.append({"uri": uri, "cid": bot.compute_cid(write["value"])})
+            return 200, {"results": results}
+        if nsid == "app.bsky.feed.getPosts":
+            return 200, {"posts": [self._view(uri) for uri in query.get("uris", []) if uri in self.posts]}
+        return 400, {"error": "MethodNotImplemented", "message": nsid}
+
+    def _tokens(self) -> dict:
+        now = self.clock.time()
+        return {
+            "did": self.did,
+            "handle": SIM_HANDLE,
+            "accessJwt": fake_jwt(self.did, now + ACCESS_TOKEN_SECONDS),
+            "refreshJwt": fake_jwt(self.did, now + REFRESH_TOKEN_SECONDS),
+        }
+
+    def _token_is_valid(self, authorization: str) -> bool:
+        expires_at = bot.jwt_expiry(authorization.removeprefix("Bearer "))
+        return expires_at is not None and expires_at > self.clock.time()
+
+    def _next_rkey(self) -> str:
+        self._sequence += 1
+        return f"sim{self._sequence:08d}"
+
+    def _store(self, rkey: str, record: dict) -> str:
+        uri = f"at://{self.did}/app.bsky.feed.post/{rkey}"
+        self.posts[uri] = {"record": record, "posted_at": self.clock.time()}
+        if not record.get("reply"):
+            self.roots.append((uri, self.clock.time()))
+        return uri
+
+    def _delete(self, rkey: str) -> None:
+        uri = f"at://{self.did}/app.bsky.feed.post/{rkey}"
+        self.posts.pop(uri, None)
+        self.roots = [(root, posted_at) for root, posted_at in self.roots if root != uri]
+
+    def _view(self, uri: str) -> dict:
+        post = self.posts[uri]
+        rng = random.Random(uri)
+        grown = min(1.0, (self.clock.time() - post["posted_at"]) / (2 * 24 * 60 * 60))
+        return {
+            "uri": uri,
+            "likeCount": int(rng.randint(0, 40) * grown),
+            "repostCount": int(rng.randint(0, 8) * grown),
+            "replyCount": int(rng.randint(0, 5) * grown),
+            "quoteCount": int(rng.randint(0, 2) * grown),
+        }
+
+
+def load_timeline(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as file:
+        timeline = json.load(file)
+    base = os.path.dirname(os.path.abspath(path))
+    snapshots = sorted(timeline["snapshots"], key=lambda snapshot: snapshot["hours"])
+    if not snapshots:
+        raise ValueError("timeline has no snapshots")
+    for snapshot in snapshots:
+        snapshot["fixtures"] = os.path.join(base, snapshot["fixtures"])
+    timeline["snapshots"] = snapshots
+    timeline["start_ts"] = datetime.fromisoformat(timeline.get("start", SIM_START)).timestamp()
+    timeline.setdefault("cycle_hours", 6)
+    timeline.setdefault("cycles", int(snapshots[-1]["hours"] // timeline["cycle_hours"]) + 1)
+    return timeline
+
+
+def snapshot_at(timeline: dict, hours: float) -> dict:
+    current = timeline["snapshots"][0]
+    for snapshot in timeline["snapshots"]:
+        if snapshot["hours"] <= hours:
+            current = snapshot
+    return current
+
+
+def timeline_feeds(timeline: dict) -> list[dict]:
+    """The RSS_FEEDS entries that appear in at least one snapshot of the timeline."""
+    urls = set()
+    for snapshot in timeline["snapshots"]:
+        with open(os.path.join(snapshot["fixtures"], "index.json"), "r", encoding="utf-8") as file:
+            urls.update(json.load(file))
+    return [feed_config for feed_config in bot.RSS_FEEDS if feed_config["url"] in urls]
+
+
+def feed_publish_times(directory: str, feed_urls: set[str]) -> dict[str, float]:
+    """Map each article link in a snapshot's feeds to its publish time."""
+    with open(os.path.join(directory, "index.json"), "r", encoding="utf-8") as file:
+        index = json.load(file)
+    published = {}
+    for url, item in index.items():
+        if url not in feed_urls:
+            continue
+        with open(os.path.join(directory, item["path"]), "rb") as file:
+            body = file.read()
+        try:
+            entries = bot.parse_feed_stream([body])
+        except (bot.ElementTree.ParseError, ValueError):
+            continue
+        for entry in entries:
+            if entry.get("link") and entry.get("published_at"):
+                published.setdefault(entry["link"], entry["published_at"])
+    return published
+
+
+def counter_total(name: str) -> float:
+    """Sum of a bot metric counter over all its labels."""
+    return sum(value for (counter, _), value in bot.METRICS.counters.items() if counter == name)
+
+
+def similarity(first: tuple[int, ...], second: tuple[int, ...]) -> float:
+    if not first or not second:
+        return 0.0
+    return sum(a == b for a, b in zip(first, second)) / len(first)
+
+
+def summarize(values: list[float]) -> dict:
+    if not values:
+        return {}
+    return {"min": min(values), "median": statistics.median(values), "max": max(values)}
+
+
+def format_duration(seconds: float) -> str:
+    if seconds < 120:
+        return f"{seconds:.0f} s"
+    if seconds < 2 * 3600:
+        return f"{seconds / 60:.1f} min"
+    return f"{seconds / 3600:.1f} h"
+
+
+def format_summary(summary: dict) -> str:
+    if not summary:
+        return "n/a"
+    return ", ".join(f"{key} {format_duration(summary[key])}" for key in ("min", "median", "max"))
+
+
+def run_simulation(args: argparse.Namespace) -> dict:
+    timeline = load_timeline(args.timeline)
+    bot_args = bot.parse_args(args.bot_args)
+    limit = max(1, min(bot_args.limit, 5))
+    cycles = args.cycles or timeline["cycles"]
+    cycle_seconds = timeline["cycle_hours"] * 3600
+    random.seed(args.seed)
+
+    clock = VirtualClock(timeline["start_ts"])
+    pds = FakePds(clock)
+    workdir = tempfile.mkdtemp(prefix="bot-sim-")
+    previous_dir = os.getcwd()
+    log = io.StringIO()
+    # Feeds missing from every snapshot would only fail and back off, so they are left out.
+    feeds = timeline_feeds(timeline)
+    feed_urls = {feed_config["url"] for feed_config in feeds}
+
+    # State files go to a scratch directory; the clock, feeds and PDS are all simulated.
+    os.chdir(workdir)
+    real_clock = bot.CLOCK
+    bot.CLOCK = clock
+    bot.HTTP_CACHE = bot.HttpValidatorCache(os.path.join(workdir, bot.HTTP_CACHE_FILE))
+    bot.ARTICLE_CACHE = bot.ArticleCache(os.path.join(workdir, bot.ARTICLE_CACHE_DIR))
+    bot.DEFAULT_ACCOUNT.engagement = bot.EngagementStore(os.path.join(workdir, "engagement.db"))
+    bot.METRICS.enabled = True
+
+    threads = []
+    cycle_reports = []
+    published_at = {}
+    active = None
+    started = time.perf_counter()
+    try:
+        session = bot.BlueskySession(SIM_HANDLE, "sim-password", os.path.join(workdir, "session.json"))
+        backlog = bot.load_backlog(bot_args)
+        health = bot.load_feed_health(bot_args)
+        posted_items = bot.load_posted_store()
+        scheduler = bot.scheduler_from_args(bot_args)
+
+        for cycle in range(cycles):
+            clock.advance_to(timeline["start_ts"] + cycle * cycle_seconds)
+            cycle_start = clock.time()
+            hours = (cycle_start - timeline["start_ts"]) / 3600
+            snapshot = snapshot_at(timeline, hours)
+            if snapshot is not active:
+                bot.HTTP.use_fixtures(snapshot["fixtures"])
+                bot.HTTP.session.mount(bot.BLUESKY_PDS_URL, pds)
+                published_at.update(feed_publish_times(snapshot["fixtures"], feed_urls))
+                active = snapshot
+
+            output = log if not args.verbose else sys.stdout
+            with contextlib.redirect_stdout(output):
+                print(f"\n=== cycle {cycle} at {clock.now().isoformat(timespec='minutes')} ===")
+                if not session.ensure():
+                    raise RuntimeError("the fake PDS refused to create a session")
+                bot.refresh_engagement(bot_args, session)
+                scored_before = counter_total("entries_scored")
+                skipped_before = counter_total("feeds_not_due")
+                bot.fetch_research_entries(
+                    feeds,
+                    workers=bot_args.fetch_workers, deadline=bot_args.fetch_deadline, backlog=backlog, health=health
+                )
+                ranked = backlog.ranked(posted_items)
+                to_post = bot.select_entries(ranked, posted_items, limit) if ranked else []
+                roots_before = len(pds.roots)
+                if to_post:
+                    bot.publish_entries(to_post, session, posted_items, False, bot_args, scheduler)
+                backlog.discard(entry.item_id for entry in to_post if entry.item_id in posted_items)
+                backlog.save()
+                health.save()
+
+            posted = [entry for entry in to_post if entry.item_id in posted_items]
+            for entry, (uri, posted_time) in zip(posted, pds.roots[roots_before:]):
+                article_time = published_at.get(entry.link)
+                threads.append(
+                    {
+                        "cycle": cycle,
+                        "posted_at": datetime.fromtimestamp(posted_time, timezone.utc).isoformat(),
+                        "posted_ts": posted_time,
+                        "article_age_seconds": posted_time - article_time if article_time else None,
+                        "title": entry.title,
+                        "source": entry.source,
+                        "score": entry.score,
+                        "link": entry.link,
+                        "item_id": entry.item_id,
+                        "uri": uri,
+                        "fingerprint": entry.fingerprint,
+                    }
+                )
+            cycle_reports.append(
+                {
+                    "cycle": cycle,
+                    "started_at": datetime.fromtimestamp(cycle_start, timezone.utc).isoformat(),
+                    "snapshot": os.path.relpath(snapshot["fixtures"], os.path.dirname(os.path.abspath(args.timeline))),
+                    "feeds_skipped": int(counter_total("feeds_not_due") - skipped_before),
+                    "new_entries": int(counter_total("entries_scored") - scored_before),
+                    "candidates": len(ranked),
+                    "selected": len(to_post),
+                    "posted": len(posted),
+                    "posting_seconds": clock.time() - cycle_start,
+                }
+            )
+    finally:
+        os.chdir(previous_dir)
+        bot.CLOCK = real_clock
+        if args.keep_state:
+            print(f"State files kept in {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    return build_report(timeline, cycles, len(feeds), cycle_reports, threads, pds, time.perf_counter() - started, log)
+
+
+def build_report(
+    timeline: dict,
+    cycles: int,
+    feed_count: int,
+    cycle_reports: list[dict],
+    threads: list[dict],
+    pds: FakePds,
+    wall_seconds: float,
+    log: io.StringIO,
+) -> dict:
+    links = {}
+    for thread in threads:
+        links.setdefault(thread["link"], []).append(thread["item_id"])
+    repeated_links = [link for link, item_ids in links.items() if len(item_ids) > 1]
+
+    near_duplicates = []
+    for index, first in enumerate(threads):
+        for second in threads[index + 1 :]:
+            score = similarity(first["fingerprint"], second["fingerprint"])
+            if score >= bot.NEAR_DUPLICATE_SIMILARITY:
+                near_duplicates.append({"first": first["title"], "second": second["title"], "similarity": score})
+
+    skipped = {
+        dict(labels)["against"]: int(value)
+        for (name, labels), value in bot.METRICS.counters.items()
+        if name == "near_duplicates_skipped"
+    }
+
+    days = cycles * timeline["cycle_hours"] / 24
+    gaps = [later["posted_ts"] - earlier["posted_ts"] for earlier, later in zip(threads, threads[1:])]
+    ages = [thread["article_age_seconds"] for thread in threads if thread["article_age_seconds"] is not None]
+    posting_seconds = [item["posting_seconds"] for item in cycle_reports if item["posted"]]
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "start": timeline.get("start", SIM_START),
+        "cycle_hours": timeline["cycle_hours"],
+        "cycles": cycles,
+        "simulated_days": days,
+        "wall_seconds": wall_seconds,
+        "threads_posted": len(threads),
+        "posts_published": len(pds.posts),
+        "threads_per_day": len(threads) / days if days else 0.0,
+        "idle_cycles": sum(1 for item in cycle_reports if not item["posted"]),
+        "feeds": feed_count,
+        "feed_polls": cycles * feed_count - sum(item["feeds_skipped"] for item in cycle_reports),
+        "feed_polls_skipped": sum(item["feeds_skipped"] for item in cycle_reports),
+        "repeated_links": repeated_links,
+        "near_duplicates": near_duplicates,
+        "near_duplicates_skipped": skipped,
+        "gap_seconds": summarize(gaps),
+        "article_age_seconds": summarize(ages),
+        "posting_seconds_per_cycle": summarize(posting_seconds),
+        "xrpc_calls": dict(sorted(pds.calls.items())),
+        "threads": [{key: value for key, value in thread.items() if key != "fingerprint"} for thread in threads],
+        "cycle_details": cycle_reports,
+        "bot_output_lines": log.getvalue().count("\n"),
+    }
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"Simulated {report['simulated_days']:.1f} days ({report['cycles']} cycles of "
+        f"{report['cycle_hours']:g} h) in {report['wall_seconds']:.1f} s"
+    )
+    print(
+        f"Threads posted: {report['threads_posted']} ({report['threads_per_day']:.1f}/day), "
+        f"{report['posts_published']} posts, {report['idle_cycles']} cycles with nothing posted"
+    )
+    skipped = report["near_duplicates_skipped"]
+    print(
+        f"Duplicates: {len(report['repeated_links'])} repeated links, "
+        f"{len(report['near_duplicates'])} near-duplicate pairs posted (similarity >= {bot.NEAR_DUPLICATE_SIMILARITY:g}); "
+        f"near-duplicate skips over all cycles: {skipped.get('posted', 0)} against posted stories, "
+        f"{skipped.get('selected', 0)} against another pick"
+    )
+    for pair in report["near_duplicates"]:
+        print(f"  {pair['similarity']:.2f}  {pair['first']}  |  {pair['second']}")
+    print(
+        f"Feed polls: {report['feed_polls']} made, {report['feed_polls_skipped']} skipped as not due "
+        f"({report['feeds']} feeds)"
+    )
+    print(f"Gap between threads: {format_summary(report['gap_seconds'])}")
+    print(f"Article age when posted: {format_summary(report['article_age_seconds'])}")
+    print(f"Posting time per cycle: {format_summary(report['posting_seconds_per_cycle'])}")
+    print(f"XRPC calls: {', '.join(f'{nsid} {count}' for nsid, count in report['xrpc_calls'].items())}")
+
+    print("\nPosted threads:")
+    for thread in report["threads"]:
+        print(f"  {thread['posted_at'][:16]}  {thread['score']:>4}  {thread['source'][:22]:<22}  {thread['title'][:70]}")
+
+
+def synthetic_sentence(rng: random.Random, vocabulary: list[str], keywords: list[str]) -> str:
+    words = rng.sample(vocabulary, 12)
+    for _ in range(rng.randint(1, 3)):
+        words.insert(rng.randint(0, len(words)), rng.choice(keywords))
+    return " ".join(words).capitalize() + "."
+
+
+def generate_timeline(args: argparse.Namespace) -> None:
+    """Write a synthetic timeline: one feed snapshot per cycle with items published in between.
+
+    A share of the items retell a story another feed published shortly
+    before, under a new title and link, to exercise near-duplicate checks.
+    """
+    rng = random.Random(args.seed)
+    keywords = list(bot.KEYWORD_MATCHER.weights)
+    # Made-up words keep unrelated stories far apart for the near-duplicate check.
+    vocabulary = sorted({"".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(3000)})
+    start = datetime.fromisoformat(SIM_START).timestamp()
+    end = start + args.days * 86400
+    feeds = bot.RSS_FEEDS[: args.feeds]
+    directory = args.directory
+    os.makedirs(os.path.join(directory, "articles"), exist_ok=True)
+
+    # Items from the two days before the start fill the first snapshot.
+    items = {feed_config["url"]: [] for feed_config in feeds}
+    stories = []
+    for feed_number, feed_config in enumerate(feeds):
+        host = urlsplit(feed_config["url"]).netloc
+        published = start - 2 * 86400
+        while True:
+            published += rng.expovariate(args.per_day / 86400)
+            if published >= end:
+                break
+            recent = [story for story in stories if story["feed"] != feed_number and 0 < published - story["published"] < 86400]
+            if recent and rng.random() < args.duplicate_rate:
+                original = rng.choice(recent)
+                title_words = original["title"].split()
+                rng.shuffle(title_words)
+                title = " ".join(title_words + [rng.choice(keywords)]).title()
+                summary, paragraphs = original["summary"], original["paragraphs"]
+            else:
+                title = " ".join(rng.sample(keywords, 3)).title()
+                summary = " ".join(synthetic_sentence(rng, vocabulary, keywords) for _ in range(3))
+                paragraphs = "".join(f"<p>{synthetic_sentence(rng, vocabulary, keywords)}</p>" for _ in range(30))
+
+            number = len(items[feed_config["url"]])
+            link = f"https://{host}/sim/{feed_number}/{number}/"
+            path = os.path.join("articles", f"feed{feed_number}_{number}.html")
+            with open(os.path.join(directory, path), "w", encoding="utf-8") as file:
+                file.write(f"<!doctype html><html><body><article><h1>{title}</h1>{paragraphs}</article></body></html>")
+            item = {"title": title, "link": link, "summary": summary, "paragraphs": paragraphs, "published": published, "path": path}
+            items[feed_config["url"]].append(item)
+            stories.append({**item, "feed": feed_number})
+
+    snapshots = []
+    cycles = int(args.days * 24 // args.cycle_hours)
+    for cycle in range(cycles):
+        now = start + cycle * args.cycle_hours * 3600
+        name = os.path.join("snapshots", f"{cycle:04d}")
+        os.makedirs(os.path.join(directory, name, "feeds"), exist_ok=True)
+        index = {}
+        for feed_number, feed_config in enumerate(feeds):
+            visible = [item for item in items[feed_config["url"]] if item["published"] <= now][-FEED_WINDOW:]
+            xml_items = "".join(
+                f"<item><title>{item['title']}</title><link>{item['link']}</link><guid>{item['link']}</guid>"
+                f"<pubDate>{datetime.fromtimestamp(item['published'], timezone.utc).strftime('%a, %d %b %Y %H:%M:%S +0000')}</pubDate>"
+                f"<description><![CDATA[{item['summary']}]]></description></item>"
+                for item in reversed(visible)
+            )
+            xml = (
+                '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0">'
+                f"<channel><title>{feed_config['name']}</title><link>{feed_config['url']}</link>{xml_items}</channel></rss>"
+            )
+            feed_path = os.path.join("feeds", f"feed{feed_number}.xml")
+            with open(os.path.join(directory, name, feed_path), "w", encoding="utf-8") as file:
+                file.write(xml)
+            index[feed_config["url"]] = {"path": feed_path, "content_type": "application/rss+xml"}
+            for item in visible:
+                index[item["link"]] = {"path": os.path.join("..", "..", item["path"]), "content_type": "text/html; charset=utf-8"}
+        benchmark.write_index(os.path.join(directory, name), index)
+        snapshots.append({"hours": cycle * args.cycle_hours, "fixtures": name})
+
+    timeline = {"start": SIM_START, "cycle_hours": args.cycle_hours, "cycles": cycles, "snapshots": snapshots}
+    with open(os.path.join(directory, "timeline.json"), "w", encoding="utf-8") as file:
+        json.dump(timeline, file, indent=2)
+        file.write("\n")
+    total = sum(len(feed_items) for feed_items in items.values())
+    print(f"Wrote {cycles} snapshots with {total} items from {len(feeds)} feeds to {directory}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Simulate scheduled bot runs offline on a virtual clock.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate = commands.add_parser("generate", help="Write a synthetic feed-snapshot timeline.")
+    generate.add_argument("directory", help="Directory to write the timeline into.")
+    generate.add_argument("--days", type=float, default=14)
+    generate.add_argument("--cycle-hours", type=float, default=6)
+    generate.add_argument("--feeds", type=int, default=6, help="How many of RSS_FEEDS to simulate.")
+    generate.add_argument("--per-day", type=float, default=2.0, help="Average new items per feed per day.")
+    generate.add_argument("--duplicate-rate", type=float, default=0.15, help="Share of items retelling another feed's story.")
+    generate.add_argument("--seed", type=int, default=1234)
+
+    run = commands.add_parser("run", help="Replay a timeline through the bot. Arguments after -- go to bot.py.")
+    run.add_argument("timeline", help="timeline.json from 'generate' or written by hand.")
+    run.add_argument("--cycles", type=int, help="Stop after this many cycles.")
+    run.add_argument("--seed", type=int, default=1, help="Seed for the posting jitter.")
+    run.add_argument("--output", help="Write the full report to this JSON file.")
+    run.add_argument("--verbose", action="store_true", help="Show the bot's own output.")
+    run.add_argument("--keep-state", action="store_true", help="Keep the scratch state directory.")
+
+    argv = sys.argv[1:]
+    bot_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, bot_args = argv[:split], argv[split + 1 :]
+    args = parser.parse_args(argv)
+    args.bot_args = bot_args
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    if args.command == "generate":
+        generate_timeline(args)
+        return
+
+    report = run_simulation(args)
+    print_report(report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
+        print(f"\nSaved report to {args.output}")
+
+
+if __name__ == "__main__":
+    main()